@@ -1,10 +1,19 @@
 """Helpers for grabbing from remote repositories."""
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 from neuromaps_prime import remote
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from neuromaps_prime.graph.models import Resource
+
 _STORAGES = {"osf": remote.OSFStorage(), "github": remote.GitHubStorage()}
 _HOST_MAP = {
     "osf.io": _STORAGES["osf"],
@@ -12,6 +21,40 @@ _HOST_MAP = {
     "raw.githubusercontent.com": _STORAGES["github"],
 }
 
+# One lock per destination, so concurrent fetches of a resource download once
+_DOWNLOAD_LOCKS: dict[Path, threading.Lock] = {}
+_DOWNLOAD_LOCKS_GUARD = threading.Lock()
+
+
+def download_lock(dest: str | Path) -> threading.Lock:
+    """Return the lock guarding downloads to *dest*.
+
+    Args:
+        dest: Output file path name
+
+    Returns:
+        The same lock for every call naming the same file.
+    """
+    key = Path(dest).absolute()
+    with _DOWNLOAD_LOCKS_GUARD:
+        return _DOWNLOAD_LOCKS.setdefault(key, threading.Lock())
+
+
+def _prefetch(resources: "Sequence[Resource]") -> list[Path]:
+    """Fetch *resources* concurrently.
+
+    Fetches are IO-bound, so overlapping the downloads makes the wall time
+    that of the slowest one.
+
+    Args:
+        resources: Resources to fetch.
+
+    Returns:
+        Local paths of *resources*, in the same order.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(resources), 1)) as pool:
+        return list(pool.map(lambda resource: resource.fetch(), resources))
+
 
 def id_storage(uri: str) -> str | None:
     """Identify the storage type.
@@ -35,6 +78,9 @@ def id_storage(uri: str) -> str | None:
 def download_and_validate(uri: str, dest: str | Path) -> None:
     """Download and validate the file.
 
+    The file is streamed to a temporary name beside *dest* and moved into
+    place only once validated, so readers never see a partial download.
+
     Args:
         uri: Remote URI to fetch data from
         dest: Output file path name
@@ -52,4 +98,10 @@ def download_and_validate(uri: str, dest: str | Path) -> None:
 
     if storage is None:
         raise ValueError(f"Could not identify storage from uri: {uri}")
-    storage.download(uri, Path(dest))  # type: ignore[attr-defined]
+    dest = Path(dest)
+    partial = dest.with_name(f".{dest.name}.{os.getpid()}-{threading.get_ident()}")
+    try:
+        storage.download(uri, partial)  # type: ignore[attr-defined]
+        partial.replace(dest)
+    finally:
+        partial.unlink(missing_ok=True)
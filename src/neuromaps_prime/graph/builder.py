@@ -10,16 +10,23 @@ Intentionally stateless beyond the dependencies injected at construction:
 
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata
+import json
+import os
+import sys
+import threading
 from pathlib import Path  # noqa: TC003 (pydantic req'd)
-from typing import TYPE_CHECKING, Any, cast
+from typing import IO, TYPE_CHECKING, Any, TypeVar, cast
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from neuromaps_prime.graph.cache import GraphCache  # noqa: TC001 (pydantic req'd)
 from neuromaps_prime.graph.models import (
     Edge,
     Node,
+    Resource,
     SurfaceAnnotation,
     SurfaceAtlas,
     SurfaceTransform,
@@ -32,10 +39,34 @@ from neuromaps_prime.resources import NEUROMAPSPRIME_GRAPH
 if TYPE_CHECKING:
     import networkx as nx
 
+# Prefer the libyaml-backed C parser when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore[assignment]
+
+_ResourceT = TypeVar("_ResourceT", bound=Resource)
+
+# (source, target, key, attrs) tuple accepted by ``add_edges_from``
+EdgeSpec = tuple[str, str, str, dict[str, Any]]
+
+# Parsed graph definitions are cached as JSON under data_dir, named by hashes
+# of the YAML file's location and of the package version and its contents
+SNAPSHOT_SUFFIX = ".snapshot.json"
+SNAPSHOT_DIR = ".graph_snapshots"
+
+try:
+    _PACKAGE_VERSION = importlib.metadata.version("neuromaps-prime")
+except importlib.metadata.PackageNotFoundError:  # pragma: no cover
+    _PACKAGE_VERSION = "unknown"
+
 
 class GraphBuilder(BaseModel):
     """Parses YAML/dict definitions and populates a graph and its cache.
 
+    Space names used as graph node keys are interned while parsing so they
+    share the interned strings the models store for their key fields.
+
     Attributes:
         cache: The :class:`GraphCache` instance that will be populated during
             build.
@@ -47,6 +78,7 @@ class GraphBuilder(BaseModel):
 
     cache: GraphCache
     data_dir: Path
+    _trusted: bool = PrivateAttr(default=False)
 
     # ------------------------------------------------------------------ #
     # Public entry points                                                  #
@@ -55,40 +87,45 @@ class GraphBuilder(BaseModel):
     def build_default(self, graph: nx.MultiDiGraph) -> None:  # pragma: no cover
         """Populate graph and cache using default resources.
 
+        Definition files are parsed and built one at a time so that only a
+        single file's parsed tree is held in memory. All nodes are built
+        before any edges so edges always connect fully-populated nodes.
+        Parsed files are snapshotted under ``data_dir`` to skip YAML parsing
+        on later startups. The bundled definitions ship with the package, so
+        their resources are constructed without validation.
+
         This method is tested through initialization of the fixture.
 
         Args:
             graph: The NetworkX graph to populate with nodes and edges.
         """
-
-        def _load_dict(paths: tuple[Path, ...]) -> list[dict[str, Any]]:
-            return [yaml.safe_load(path.read_bytes()) for path in paths]
-
-        def _load_list(paths: tuple[Path, ...]) -> list[dict[str, Any]]:
-            merged = []
-            for path in paths:
-                merged.extend(yaml.safe_load(path.read_bytes()))
-            return merged
-
-        data = {
-            "nodes": _load_dict(NEUROMAPSPRIME_GRAPH.nodes),
-            "edges": {
-                "surface_to_surface": _load_list(NEUROMAPSPRIME_GRAPH.surface_edges),
-                "volume_to_volume": _load_list(NEUROMAPSPRIME_GRAPH.volume_edges),
-            },
-        }
-        self.build_from_dict(graph, data)
+        self._trusted = True
+        try:
+            for path in NEUROMAPSPRIME_GRAPH.nodes:
+                self._build_nodes(graph, [self._load_snapshotted(path)])
+            for path in NEUROMAPSPRIME_GRAPH.surface_edges:
+                self._build_edges(
+                    graph, {"surface_to_surface": self._load_snapshotted(path)}
+                )
+            for path in NEUROMAPSPRIME_GRAPH.volume_edges:
+                self._build_edges(
+                    graph, {"volume_to_volume": self._load_snapshotted(path)}
+                )
+        finally:
+            self._trusted = False
 
     def build_from_yaml(self, graph: nx.MultiDiGraph, yaml_file: Path) -> None:
         """Populate graph and cache from a YAML file.
 
+        The parsed definition is snapshotted under ``data_dir`` and reused on
+        later loads of identical YAML contents, skipping the comparatively
+        slow YAML parse.
+
         Args:
             graph: The NetworkX graph to populate with nodes and edges.
             yaml_file: Path to the YAML definition file.
         """
-        with yaml_file.open() as fh:
-            data = yaml.safe_load(fh)
-        self.build_from_dict(graph, data)
+        self.build_from_dict(graph, self._load_snapshotted(yaml_file))
 
     def build_from_dict(self, graph: nx.MultiDiGraph, data: dict[str, Any]) -> None:
         """Populate graph and cache from a dictionary.
@@ -110,6 +147,7 @@ class GraphBuilder(BaseModel):
         """Parse all node entries and add them to graph and cache."""
         for node_entry in nodes_list:
             ((node_name, node_data),) = node_entry.items()
+            node_name = sys.intern(node_name)
             description = node_data.get("description", "")
 
             surfaces, surface_annotations = self._parse_surface_resources(
@@ -122,7 +160,8 @@ class GraphBuilder(BaseModel):
                 {"space": node_name, "description": description},
                 node_data.get("volumes", {}),
             )
-            node_obj = Node(
+            # Members were validated on construction; skip re-validating them
+            node_obj = Node.model_construct(
                 name=node_name,
                 species=node_data.get("species", ""),
                 description=description,
@@ -143,17 +182,27 @@ class GraphBuilder(BaseModel):
     # ------------------------------------------------------------------ #
 
     def _build_edges(self, graph: nx.MultiDiGraph, edges_dict: dict[str, Any]) -> None:
-        """Parse all edge entries and add them to graph and cache."""
-        for edge_data in edges_dict.get("surface_to_surface", []):
-            self._build_surface_edge(graph, edge_data)
-        for edge_data in edges_dict.get("volume_to_volume", []):
-            self._build_volume_edge(graph, edge_data)
-
-    def _build_surface_edge(
-        self, graph: nx.MultiDiGraph, edge_data: dict[str, Any]
-    ) -> None:
-        """Parse a single surface-to-surface edge definition."""
-        source, target = edge_data["from"], edge_data["to"]
+        """Parse all edge entries, add them to the cache and bulk-add to graph."""
+        edges = [
+            self._parse_surface_edge(edge_data)
+            for edge_data in edges_dict.get("surface_to_surface", [])
+        ]
+        edges.extend(
+            self._parse_volume_edge(edge_data)
+            for edge_data in edges_dict.get("volume_to_volume", [])
+        )
+        graph.add_edges_from(edges)
+
+    def _parse_surface_edge(self, edge_data: dict[str, Any]) -> EdgeSpec:
+        """Parse a single surface-to-surface edge definition.
+
+        Args:
+            edge_data: Edge definition with ``from``, ``to`` and ``surfaces``.
+
+        Returns:
+            ``(source, target, key, attrs)`` tuple for ``add_edges_from``.
+        """
+        source, target = sys.intern(edge_data["from"]), sys.intern(edge_data["to"])
         transforms, _ = self._parse_surface_resources(
             SurfaceTransform,
             {
@@ -163,20 +212,20 @@ class GraphBuilder(BaseModel):
             },
             edge_data.get("surfaces", {}),
         )
-        graph.add_edge(
-            source,
-            target,
-            key="surface_to_surface",
-            data=Edge(surface_transforms=cast("list[SurfaceTransform]", transforms)),
-            weight=1.0,
-        )
         self.cache.add_surface_transforms(cast("list[SurfaceTransform]", transforms))
+        edge = Edge(surface_transforms=cast("list[SurfaceTransform]", transforms))
+        return source, target, "surface_to_surface", {"data": edge, "weight": 1.0}
 
-    def _build_volume_edge(
-        self, graph: nx.MultiDiGraph, edge_data: dict[str, Any]
-    ) -> None:
-        """Parse a single volume-to-volume edge definition."""
-        source, target = edge_data["from"], edge_data["to"]
+    def _parse_volume_edge(self, edge_data: dict[str, Any]) -> EdgeSpec:
+        """Parse a single volume-to-volume edge definition.
+
+        Args:
+            edge_data: Edge definition with ``from``, ``to`` and ``volumes``.
+
+        Returns:
+            ``(source, target, key, attrs)`` tuple for ``add_edges_from``.
+        """
+        source, target = sys.intern(edge_data["from"]), sys.intern(edge_data["to"])
         transforms, _ = self._parse_volume_resources(
             VolumeTransform,
             {
@@ -186,14 +235,59 @@ class GraphBuilder(BaseModel):
             },
             edge_data.get("volumes", {}),
         )
-        graph.add_edge(
-            source,
-            target,
-            key="volume_to_volume",
-            data=Edge(volume_transforms=cast("list[VolumeTransform]", transforms)),
-            weight=1.0,
-        )
         self.cache.add_volume_transforms(cast("list[VolumeTransform]", transforms))
+        edge = Edge(volume_transforms=cast("list[VolumeTransform]", transforms))
+        return source, target, "volume_to_volume", {"data": edge, "weight": 1.0}
+
+    # ------------------------------------------------------------------ #
+    # Path helpers                                                         #
+    # ------------------------------------------------------------------ #
+
+    def _load_snapshotted(self, path: Path) -> Any:  # noqa: ANN401
+        """Parse a YAML definition file, reusing its snapshot if one exists.
+
+        Snapshots are named by a hash of the file's location followed by a
+        hash of the package version and its contents, so installs sharing a
+        data_dir never reuse each other's parses and writing a new snapshot
+        can prune the stale ones for the same file.
+
+        Args:
+            path: YAML definition file.
+
+        Returns:
+            The parsed definition.
+        """
+        raw = path.read_bytes()
+        source = hashlib.sha256(os.fsencode(path.absolute())).hexdigest()[:16]
+        digest = hashlib.sha256(_PACKAGE_VERSION.encode() + b"\0" + raw).hexdigest()
+        snapshot = self.data_dir / SNAPSHOT_DIR / f"{source}.{digest}{SNAPSHOT_SUFFIX}"
+        data = _read_snapshot(snapshot)
+        if data is None:
+            data = _load_yaml(raw)
+            if _write_snapshot(snapshot, data):
+                for stale in snapshot.parent.glob(f"{source}.*{SNAPSHOT_SUFFIX}"):
+                    if stale != snapshot:
+                        stale.unlink(missing_ok=True)
+        return data
+
+    def _resource(self, cls: type[_ResourceT], **fields: Any) -> _ResourceT:  # noqa: ANN401
+        """Construct a resource, skipping validation for trusted definitions.
+
+        Trusted resources still get the hemisphere normalisation the models'
+        validators apply, since it decides which cache keys they land under.
+
+        Args:
+            cls: Resource model class to instantiate.
+            **fields: Field values for the resource.
+
+        Returns:
+            The constructed resource.
+        """
+        if self._trusted:
+            if isinstance(hemisphere := fields.get("hemisphere"), str):
+                fields["hemisphere"] = sys.intern(hemisphere.lower())
+            return cls.unchecked(**fields)
+        return cls(**fields)
 
     # ------------------------------------------------------------------ #
     # Generic resource parsers                                             #
@@ -225,7 +319,8 @@ class GraphBuilder(BaseModel):
                 name = f"{prefix}_{density}_{hemi}_{annot}"
                 ext = "func.gii" if "PC" in annot else "label.gii"
                 annotations.append(
-                    SurfaceAnnotation(
+                    self._resource(
+                        SurfaceAnnotation,
                         name=name,
                         space=space,
                         label=annot,
@@ -271,7 +366,8 @@ class GraphBuilder(BaseModel):
         """
         extra = {"provider": provider} if cls is SurfaceTransform else {}
         return [
-            cls(
+            self._resource(
+                cls,
                 name=(name := f"{prefix}_{density}_{hemi}_{surf_type}"),
                 uri=path,
                 file_path=self.data_dir / f"{name}.surf.gii",
@@ -398,7 +494,8 @@ class GraphBuilder(BaseModel):
                         for annot_key, annot_dict in vol_value.items():
                             name = f"{prefix}_{res}_{annot_key}"
                             annotations.append(
-                                VolumeAnnotation(
+                                self._resource(
+                                    VolumeAnnotation,
                                     name=name,
                                     space=space,
                                     label=annot_key,
@@ -414,7 +511,8 @@ class GraphBuilder(BaseModel):
                     extra = {"provider": provider} if is_transform else {}
                     name = f"{prefix}_{res}_{vol_type}"
                     result.append(
-                        cls(
+                        self._resource(
+                            cls,
                             name=name,
                             uri=vol_value,
                             file_path=self.data_dir / f"{name}.nii.gz",
@@ -429,3 +527,74 @@ class GraphBuilder(BaseModel):
         if cls is VolumeAtlas:
             return cast("list[VolumeAtlas]", result), annotations
         return cast("list[VolumeTransform]", result), annotations
+
+
+# ---------------------------------------------------------------------------
+# Loading helpers
+# ---------------------------------------------------------------------------
+
+
+def _load_yaml(stream: bytes | IO[bytes]) -> Any:  # noqa: ANN401
+    """Safely parse YAML, using the C-accelerated loader when available.
+
+    File objects should be opened in binary mode so the parser reads the
+    buffered bytes directly and handles decoding itself.
+
+    Args:
+        stream: YAML document as bytes or a binary file object.
+
+    Returns:
+        The parsed document.
+    """
+    return yaml.load(stream, Loader=YamlSafeLoader)
+
+
+def _read_snapshot(snapshot: Path) -> Any:  # noqa: ANN401
+    """Return the parsed contents of *snapshot*, or ``None`` if unavailable.
+
+    Args:
+        snapshot: JSON snapshot previously written for a definition file.
+
+    Returns:
+        The snapshotted graph definition, or ``None`` when the snapshot is
+        missing or unreadable.
+    """
+    try:
+        return json.loads(snapshot.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_snapshot(snapshot: Path, data: Any) -> bool:  # noqa: ANN401
+    """Write *data* to *snapshot* as JSON on a best-effort basis.
+
+    Unwritable locations, and YAML values that JSON cannot round-trip
+    unchanged (e.g. non-string keys), simply skip the snapshot. The file is
+    written beside *snapshot* and moved into place, so readers never see a
+    partial snapshot.
+
+    Args:
+        snapshot: Destination snapshot path.
+        data: Parsed graph definition.
+
+    Returns:
+        Whether the snapshot was written.
+    """
+    try:
+        encoded = json.dumps(data)
+        if json.loads(encoded) != data:
+            return False
+    except (TypeError, ValueError):
+        return False
+    partial = snapshot.with_name(
+        f".{snapshot.name}.{os.getpid()}-{threading.get_ident()}"
+    )
+    try:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        partial.write_text(encoded)
+        partial.replace(snapshot)
+    except OSError:
+        return False
+    finally:
+        partial.unlink(missing_ok=True)
+    return True
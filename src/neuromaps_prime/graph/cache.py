@@ -6,9 +6,10 @@ queries and require_* helpers that raise on a miss.
 
 from __future__ import annotations
 
-from typing import Literal
-
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from operator import itemgetter
+from sys import intern
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 from neuromaps_prime.graph.models import (
     SurfaceAnnotation,  # noqa: TC001 (pydantic req'd)
@@ -18,6 +19,12 @@ from neuromaps_prime.graph.models import (
     VolumeAtlas,  # noqa: TC001 (pydantic req'd)
     VolumeTransform,  # noqa: TC001 (pydantic req'd)
 )
+from neuromaps_prime.transforms.utils import _get_density_key
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_T = TypeVar("_T")
 
 # Key type aliases
 SurfaceAtlasKey = tuple[str, str, str, str]  # (space, density, hemi, resource_type)
@@ -31,8 +38,26 @@ VolumeTransformKey = tuple[
 ]  # (src, tgt, resolution, resource_type, provider)
 VolumeAnnotationKey = tuple[str, str, str]  # (space, label, resolution)
 
+# Lookup tables and secondary indexes emptied by GraphCache.clear(); the
+# density key memo is kept since parsed densities never go stale.
+_TABLES = (
+    "surface_atlas",
+    "surface_transform",
+    "surface_annotation",
+    "volume_atlas",
+    "volume_transform",
+    "volume_annotation",
+    "_surface_atlas_by_space",
+    "_surface_transform_by_pair",
+    "_volume_atlas_by_space",
+    "_volume_transform_by_pair",
+    "_surface_transform_any",
+    "_volume_transform_any",
+)
+
 
-class GraphCache(BaseModel):
+@dataclass(slots=True)
+class GraphCache:
     """Container for all atlas, transform, and annotation lookup tables.
 
     All dictionaries are keyed by stable tuples so that lookups are O(1).
@@ -53,24 +78,90 @@ class GraphCache(BaseModel):
             provider)`` to a :class:`VolumeTransform`.
         volume_annotation: Maps ``(space, label, resolution)`` to a
             :class:`VolumeAnnotation`.
-    """
 
-    model_config = {"arbitrary_types_allowed": True}
+    Transform tables are also indexed without the trailing ``provider`` key
+    component, so provider-agnostic lookups resolve to the first registered
+    provider with a single dict access. Atlases are additionally grouped by
+    space, and transforms by ``(source, target)`` pair, so filtered searches
+    only scan the entries that can match.
+    """
 
-    surface_atlas: dict[SurfaceAtlasKey, SurfaceAtlas] = Field(default_factory=dict)
-    surface_transform: dict[SurfaceTransformKey, SurfaceTransform] = Field(
+    surface_atlas: dict[SurfaceAtlasKey, SurfaceAtlas] = field(default_factory=dict)
+    surface_transform: dict[SurfaceTransformKey, SurfaceTransform] = field(
         default_factory=dict
     )
-    surface_annotation: dict[SurfaceAnnotationKey, SurfaceAnnotation] = Field(
+    surface_annotation: dict[SurfaceAnnotationKey, SurfaceAnnotation] = field(
         default_factory=dict
     )
-    volume_atlas: dict[VolumeAtlasKey, VolumeAtlas] = Field(default_factory=dict)
-    volume_transform: dict[VolumeTransformKey, VolumeTransform] = Field(
+    volume_atlas: dict[VolumeAtlasKey, VolumeAtlas] = field(default_factory=dict)
+    volume_transform: dict[VolumeTransformKey, VolumeTransform] = field(
         default_factory=dict
     )
-    volume_annotation: dict[VolumeAnnotationKey, VolumeAnnotation] = Field(
+    volume_annotation: dict[VolumeAnnotationKey, VolumeAnnotation] = field(
         default_factory=dict
     )
+    _surface_atlas_by_space: dict[str, dict[SurfaceAtlasKey, SurfaceAtlas]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _surface_transform_by_pair: dict[
+        tuple[str, str], dict[SurfaceTransformKey, SurfaceTransform]
+    ] = field(default_factory=dict, init=False, repr=False)
+    _volume_atlas_by_space: dict[str, dict[VolumeAtlasKey, VolumeAtlas]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _volume_transform_by_pair: dict[
+        tuple[str, str], dict[VolumeTransformKey, VolumeTransform]
+    ] = field(default_factory=dict, init=False, repr=False)
+    _surface_transform_any: dict[tuple[str, ...], SurfaceTransform] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _volume_transform_any: dict[tuple[str, ...], VolumeTransform] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _density_keys: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _version: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index any entries passed to the constructor."""
+        for key, atlas in self.surface_atlas.items():
+            self.density_key(atlas.density)
+            self._surface_atlas_by_space.setdefault(key[0], {})[key] = atlas
+        for key, transform in self.surface_transform.items():
+            self.density_key(transform.density)
+            self._surface_transform_by_pair.setdefault(key[:2], {})[key] = transform
+            _index_first_provider(self._surface_transform_any, key, transform)
+        for key, atlas in self.volume_atlas.items():
+            self._volume_atlas_by_space.setdefault(key[0], {})[key] = atlas
+        for key, transform in self.volume_transform.items():
+            self._volume_transform_by_pair.setdefault(key[:2], {})[key] = transform
+            _index_first_provider(self._volume_transform_any, key, transform)
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every insert or clear, for invalidating memos."""
+        return self._version
+
+    # ------------------------------------------------------------------ #
+    # Density ordering                                                     #
+    # ------------------------------------------------------------------ #
+
+    def density_key(self, density: str) -> int:
+        """Return the numeric sort key for a density string (e.g. ``'32k'``).
+
+        Keys are parsed once per distinct density and memoised; densities of
+        registered surface resources are parsed as they are added.
+
+        Args:
+            density: Surface mesh density string.
+
+        Returns:
+            Approximate integer vertex count used for ordering.
+        """
+        try:
+            return self._density_keys[density]
+        except KeyError:
+            key = self._density_keys[density] = _get_density_key(density)
+            return key
 
     # ------------------------------------------------------------------ #
     # Surface atlas                                                        #
@@ -78,9 +169,11 @@ class GraphCache(BaseModel):
 
     def add_surface_atlas(self, atlas: SurfaceAtlas) -> None:
         """Insert or overwrite a surface atlas entry."""
-        self.surface_atlas[
-            (atlas.space, atlas.density, atlas.hemisphere.lower(), atlas.resource_type)
-        ] = atlas
+        self._version += 1
+        self.density_key(atlas.density)
+        key = _surface_atlas_key(atlas)
+        self.surface_atlas[key] = atlas
+        self._surface_atlas_by_space.setdefault(atlas.space, {})[key] = atlas
 
     def get_surface_atlas(
         self,
@@ -112,14 +205,15 @@ class GraphCache(BaseModel):
         Returns:
             All matching :class:`SurfaceAtlas` entries (may be empty).
         """
-        return [
-            atlas
-            for (sp, d, h, rt), atlas in self.surface_atlas.items()
-            if sp == space
-            and (density is None or d == density)
-            and (hemisphere is None or h == hemisphere.lower())
-            and (resource_type is None or rt == resource_type)
-        ]
+        hemi = hemisphere.lower() if hemisphere is not None else None
+        if density is not None and hemi is not None and resource_type is not None:
+            return _as_list(
+                self.surface_atlas.get((space, density, hemi, resource_type))
+            )
+        return _filter_by_key(
+            self._surface_atlas_by_space.get(space, {}),
+            {1: density, 2: hemi, 3: resource_type},
+        )
 
     def require_surface_atlas(
         self,
@@ -150,20 +244,47 @@ class GraphCache(BaseModel):
             )
         return atlas
 
+    def require_surface_atlases(
+        self,
+        space: str,
+        density: str,
+        hemisphere: Literal["left", "right"],
+        resource_types: Iterable[str],
+    ) -> dict[str, SurfaceAtlas]:
+        """Return the :class:`SurfaceAtlas` for each of *resource_types*.
+
+        Args:
+            space: Brain template space name.
+            density: Surface mesh density.
+            hemisphere: ``'left'`` or ``'right'``.
+            resource_types: Surface resource types to look up.
+
+        Returns:
+            Mapping of resource type to its :class:`SurfaceAtlas`.
+
+        Raises:
+            ValueError: If any requested atlas is missing; names the first one.
+        """
+        hemi = hemisphere.lower()
+        atlases: dict[str, SurfaceAtlas] = {}
+        for resource_type in resource_types:
+            atlas = self.surface_atlas.get((space, density, hemi, resource_type))
+            if atlas is None:
+                raise ValueError(
+                    f"No '{resource_type}' surface atlas found for space '{space}' "
+                    f"(density='{density}', hemisphere='{hemisphere}')"
+                )
+            atlases[resource_type] = atlas
+        return atlases
+
     # ------------------------------------------------------------------ #
     # Surface annotation                                                   #
     # ------------------------------------------------------------------ #
 
     def add_surface_annotation(self, annotation: SurfaceAnnotation) -> None:
         """Insert or overwrite a surface annotation entry."""
-        self.surface_annotation[
-            (
-                annotation.space,
-                annotation.label,
-                annotation.density,
-                annotation.hemisphere.lower(),
-            )
-        ] = annotation
+        self._version += 1
+        self.surface_annotation[_surface_annotation_key(annotation)] = annotation
 
     def get_surface_annotation(
         self, space: str, label: str, density: str, hemisphere: Literal["left", "right"]
@@ -189,14 +310,12 @@ class GraphCache(BaseModel):
         Returns:
             All matching :class:`SurfaceAnnotation` entries (may be empty).
         """
-        return [
-            annotation
-            for (sp, lb, d, h), annotation in self.surface_annotation.items()
-            if sp == space
-            and (label is None or lb == label)
-            and (density is None or d == density)
-            and (hemisphere is None or h == hemisphere.lower())
-        ]
+        hemi = hemisphere.lower() if hemisphere is not None else None
+        if label is not None and density is not None and hemi is not None:
+            return _as_list(self.surface_annotation.get((space, label, density, hemi)))
+        return _filter_by_key(
+            self.surface_annotation, {0: space, 1: label, 2: density, 3: hemi}
+        )
 
     def require_surface_annotation(
         self, space: str, label: str, density: str, hemisphere: Literal["left", "right"]
@@ -229,16 +348,12 @@ class GraphCache(BaseModel):
 
     def add_surface_transform(self, transform: SurfaceTransform) -> None:
         """Insert or overwrite a surface transform entry."""
-        self.surface_transform[
-            (
-                transform.source_space,
-                transform.target_space,
-                transform.density,
-                transform.hemisphere.lower(),
-                transform.resource_type,
-                transform.provider,
-            )
-        ] = transform
+        self._version += 1
+        self.density_key(transform.density)
+        key = _surface_transform_key(transform)
+        self.surface_transform[key] = transform
+        self._surface_transform_by_pair.setdefault(key[:2], {})[key] = transform
+        _index_first_provider(self._surface_transform_any, key, transform)
 
     def get_surface_transform(
         self,
@@ -255,22 +370,16 @@ class GraphCache(BaseModel):
         If *provider* is ``None`` or not found, falls back to the first
         registered transform matching the other fields.
         """
+        hemi = hemisphere.lower()
         if provider is not None:
             result = self.surface_transform.get(
-                (source, target, density, hemisphere.lower(), resource_type, provider)
+                (source, target, density, hemi, resource_type, provider)
             )
             if result is not None:
                 return result
-        for (src, tgt, d, h, rt, _), transform in self.surface_transform.items():
-            if (
-                src == source
-                and tgt == target
-                and d == density
-                and h == hemisphere.lower()
-                and rt == resource_type
-            ):
-                return transform
-        return None
+        return self._surface_transform_any.get(
+            (source, target, density, hemi, resource_type)
+        )
 
     def get_surface_transforms(
         self,
@@ -295,16 +404,22 @@ class GraphCache(BaseModel):
         Returns:
             All matching :class:`SurfaceTransform` entries (may be empty).
         """
-        return [
-            transform
-            for (src, tgt, d, h, rt, prov), transform in self.surface_transform.items()
-            if src == source
-            and tgt == target
-            and (density is None or d == density)
-            and (hemisphere is None or h == hemisphere.lower())
-            and (resource_type is None or rt == resource_type)
-            and (provider is None or prov == provider)
-        ]
+        hemi = hemisphere.lower() if hemisphere is not None else None
+        if (
+            density is not None
+            and hemi is not None
+            and resource_type is not None
+            and provider is not None
+        ):
+            return _as_list(
+                self.surface_transform.get(
+                    (source, target, density, hemi, resource_type, provider)
+                )
+            )
+        return _filter_by_key(
+            self._surface_transform_by_pair.get((source, target), {}),
+            {2: density, 3: hemi, 4: resource_type, 5: provider},
+        )
 
     # ------------------------------------------------------------------ #
     # Volume atlas                                                         #
@@ -312,7 +427,10 @@ class GraphCache(BaseModel):
 
     def add_volume_atlas(self, atlas: VolumeAtlas) -> None:
         """Insert or overwrite a volume atlas entry."""
-        self.volume_atlas[(atlas.space, atlas.resolution, atlas.resource_type)] = atlas
+        self._version += 1
+        key = _volume_atlas_key(atlas)
+        self.volume_atlas[key] = atlas
+        self._volume_atlas_by_space.setdefault(atlas.space, {})[key] = atlas
 
     def get_volume_atlas(
         self, space: str, resolution: str, resource_type: str
@@ -336,13 +454,12 @@ class GraphCache(BaseModel):
         Returns:
             All matching :class:`VolumeAtlas` entries (may be empty).
         """
-        return [
-            atlas
-            for (sp, res, rt), atlas in self.volume_atlas.items()
-            if sp == space
-            and (resolution is None or res == resolution)
-            and (resource_type is None or rt == resource_type)
-        ]
+        if resolution is not None and resource_type is not None:
+            return _as_list(self.volume_atlas.get((space, resolution, resource_type)))
+        return _filter_by_key(
+            self._volume_atlas_by_space.get(space, {}),
+            {1: resolution, 2: resource_type},
+        )
 
     def require_volume_atlas(
         self, space: str, resolution: str, resource_type: str
@@ -374,9 +491,8 @@ class GraphCache(BaseModel):
 
     def add_volume_annotation(self, annotation: VolumeAnnotation) -> None:
         """Insert or overwrite a volume annotation entry."""
-        self.volume_annotation[
-            (annotation.space, annotation.label, annotation.resolution)
-        ] = annotation
+        self._version += 1
+        self.volume_annotation[_volume_annotation_key(annotation)] = annotation
 
     def get_volume_annotation(
         self, space: str, label: str, resolution: str
@@ -397,13 +513,11 @@ class GraphCache(BaseModel):
         Returns:
             All matching :class:`VolumeAnnotation` entries (may be empty).
         """
-        return [
-            annotation
-            for (sp, lb, res), annotation in self.volume_annotation.items()
-            if sp == space
-            and (label is None or lb == label)
-            and (resolution is None or res == resolution)
-        ]
+        if label is not None and resolution is not None:
+            return _as_list(self.volume_annotation.get((space, label, resolution)))
+        return _filter_by_key(
+            self.volume_annotation, {0: space, 1: label, 2: resolution}
+        )
 
     def require_volume_annotation(
         self, space: str, label: str, resolution: str
@@ -435,15 +549,11 @@ class GraphCache(BaseModel):
 
     def add_volume_transform(self, transform: VolumeTransform) -> None:
         """Insert or overwrite a volume transform entry."""
-        self.volume_transform[
-            (
-                transform.source_space,
-                transform.target_space,
-                transform.resolution,
-                transform.resource_type,
-                transform.provider,
-            )
-        ] = transform
+        self._version += 1
+        key = _volume_transform_key(transform)
+        self.volume_transform[key] = transform
+        self._volume_transform_by_pair.setdefault(key[:2], {})[key] = transform
+        _index_first_provider(self._volume_transform_any, key, transform)
 
     def get_volume_transform(
         self,
@@ -465,15 +575,9 @@ class GraphCache(BaseModel):
             )
             if result is not None:
                 return result
-        for (src, tgt, res, rt, _), transform in self.volume_transform.items():
-            if (
-                src == source
-                and tgt == target
-                and res == resolution
-                and rt == resource_type
-            ):
-                return transform
-        return None
+        return self._volume_transform_any.get(
+            (source, target, resolution, resource_type)
+        )
 
     def get_volume_transforms(
         self,
@@ -496,15 +600,20 @@ class GraphCache(BaseModel):
         Returns:
             All matching :class:`VolumeTransform` entries (may be empty).
         """
-        return [
-            transform
-            for (src, tgt, res, rt, prov), transform in self.volume_transform.items()
-            if src == source
-            and tgt == target
-            and (resolution is None or res == resolution)
-            and (resource_type is None or rt == resource_type)
-            and (provider is None or prov == provider)
-        ]
+        if (
+            resolution is not None
+            and resource_type is not None
+            and provider is not None
+        ):
+            return _as_list(
+                self.volume_transform.get(
+                    (source, target, resolution, resource_type, provider)
+                )
+            )
+        return _filter_by_key(
+            self._volume_transform_by_pair.get((source, target), {}),
+            {2: resolution, 3: resource_type, 4: provider},
+        )
 
     # ------------------------------------------------------------------ #
     # Bulk helpers (used by GraphBuilder)                                  #
@@ -512,39 +621,176 @@ class GraphCache(BaseModel):
 
     def add_surface_atlases(self, atlases: list[SurfaceAtlas]) -> None:
         """Bulk-insert surface atlases."""
-        for atlas in atlases:
-            self.add_surface_atlas(atlas)
+        self._version += 1
+        for density in {atlas.density for atlas in atlases}:
+            self.density_key(density)
+        keyed = [(_surface_atlas_key(a), a) for a in atlases]
+        self.surface_atlas.update(keyed)
+        for key, atlas in keyed:
+            self._surface_atlas_by_space.setdefault(atlas.space, {})[key] = atlas
 
     def add_surface_annotations(self, annotations: list[SurfaceAnnotation]) -> None:
         """Bulk-insert surface annotations."""
-        for annotation in annotations:
-            self.add_surface_annotation(annotation)
+        self._version += 1
+        self.surface_annotation.update(
+            (_surface_annotation_key(a), a) for a in annotations
+        )
 
     def add_surface_transforms(self, transforms: list[SurfaceTransform]) -> None:
         """Bulk-insert surface transforms."""
-        for transform in transforms:
-            self.add_surface_transform(transform)
+        self._version += 1
+        for density in {transform.density for transform in transforms}:
+            self.density_key(density)
+        keyed = [(_surface_transform_key(t), t) for t in transforms]
+        self.surface_transform.update(keyed)
+        for key, transform in keyed:
+            self._surface_transform_by_pair.setdefault(key[:2], {})[key] = transform
+            _index_first_provider(self._surface_transform_any, key, transform)
 
     def add_volume_atlases(self, atlases: list[VolumeAtlas]) -> None:
         """Bulk-insert volume atlases."""
-        for atlas in atlases:
-            self.add_volume_atlas(atlas)
+        self._version += 1
+        keyed = [(_volume_atlas_key(a), a) for a in atlases]
+        self.volume_atlas.update(keyed)
+        for key, atlas in keyed:
+            self._volume_atlas_by_space.setdefault(atlas.space, {})[key] = atlas
 
     def add_volume_annotations(self, annotations: list[VolumeAnnotation]) -> None:
         """Bulk-insert volume annotations."""
-        for annotation in annotations:
-            self.add_volume_annotation(annotation)
+        self._version += 1
+        self.volume_annotation.update(
+            (_volume_annotation_key(a), a) for a in annotations
+        )
 
     def add_volume_transforms(self, transforms: list[VolumeTransform]) -> None:
         """Bulk-insert volume transforms."""
-        for transform in transforms:
-            self.add_volume_transform(transform)
+        self._version += 1
+        keyed = [(_volume_transform_key(t), t) for t in transforms]
+        self.volume_transform.update(keyed)
+        for key, transform in keyed:
+            self._volume_transform_by_pair.setdefault(key[:2], {})[key] = transform
+            _index_first_provider(self._volume_transform_any, key, transform)
 
     def clear(self) -> None:
-        """Evict all entries from every cache table."""
-        self.surface_atlas.clear()
-        self.surface_transform.clear()
-        self.surface_annotation.clear()
-        self.volume_atlas.clear()
-        self.volume_transform.clear()
-        self.volume_annotation.clear()
+        """Evict all entries from every cache table and index."""
+        self._version += 1
+        for name in _TABLES:
+            getattr(self, name).clear()
+
+
+# ---------------------------------------------------------------------------
+# Key builders
+# ---------------------------------------------------------------------------
+
+
+# Key components are interned so the filtered scans, which intern their
+# filter values too, compare strings by identity.
+
+
+def _surface_atlas_key(atlas: SurfaceAtlas) -> SurfaceAtlasKey:
+    """Return the cache key for a surface atlas."""
+    return (
+        intern(atlas.space),
+        intern(atlas.density),
+        intern(atlas.hemisphere),
+        intern(atlas.resource_type),
+    )
+
+
+def _surface_annotation_key(annotation: SurfaceAnnotation) -> SurfaceAnnotationKey:
+    """Return the cache key for a surface annotation."""
+    return (
+        intern(annotation.space),
+        intern(annotation.label),
+        intern(annotation.density),
+        intern(annotation.hemisphere),
+    )
+
+
+def _surface_transform_key(transform: SurfaceTransform) -> SurfaceTransformKey:
+    """Return the cache key for a surface transform."""
+    return (
+        intern(transform.source_space),
+        intern(transform.target_space),
+        intern(transform.density),
+        intern(transform.hemisphere),
+        intern(transform.resource_type),
+        intern(transform.provider),
+    )
+
+
+def _volume_transform_key(transform: VolumeTransform) -> VolumeTransformKey:
+    """Return the cache key for a volume transform."""
+    return (
+        intern(transform.source_space),
+        intern(transform.target_space),
+        intern(transform.resolution),
+        intern(transform.resource_type),
+        intern(transform.provider),
+    )
+
+
+def _volume_atlas_key(atlas: VolumeAtlas) -> VolumeAtlasKey:
+    """Return the cache key for a volume atlas."""
+    return (intern(atlas.space), intern(atlas.resolution), intern(atlas.resource_type))
+
+
+def _volume_annotation_key(annotation: VolumeAnnotation) -> VolumeAnnotationKey:
+    """Return the cache key for a volume annotation."""
+    return (
+        intern(annotation.space),
+        intern(annotation.label),
+        intern(annotation.resolution),
+    )
+
+
+def _filter_by_key(  # noqa: UP047 (3.11 support)
+    store: dict[Any, _T], filters: dict[int, str | None]
+) -> list[_T]:
+    """Return the values of *store* whose keys match every given filter.
+
+    ``None`` filters are dropped up front and the rest are compared as a
+    single tuple extracted by :func:`operator.itemgetter`, so each entry
+    costs one C-level call and one tuple comparison. Filter values are
+    interned to match the interned key components. The entries are copied
+    before scanning so concurrent inserts cannot break the iteration.
+
+    Args:
+        store: Table or index bucket keyed by resource key tuples.
+        filters: Maps key position to the required value, or ``None`` to
+            accept any value at that position.
+
+    Returns:
+        Matching values in insertion order.
+    """
+    active = {i: intern(value) for i, value in filters.items() if value is not None}
+    if not active:
+        return list(store.values())
+    getter = itemgetter(*active)
+    needle = tuple(active.values()) if len(active) > 1 else next(iter(active.values()))
+    return [value for key, value in list(store.items()) if getter(key) == needle]
+
+
+def _as_list(resource: _T | None) -> list[_T]:  # noqa: UP047 (3.11 support)
+    """Wrap the result of a direct lookup as a filtered-query result list."""
+    return [] if resource is None else [resource]
+
+
+def _index_first_provider(
+    index: dict[tuple[str, ...], SurfaceTransform | VolumeTransform],
+    key: tuple[str, ...],
+    transform: SurfaceTransform | VolumeTransform,
+) -> None:
+    """Record *transform* in a provider-agnostic *index*.
+
+    The first registered provider for a key wins, mirroring the insertion
+    order of the full table; re-registering that same provider replaces it.
+
+    Args:
+        index: Index keyed by the full key without its trailing provider.
+        key: Full cache key whose last component is the provider.
+        transform: Transform stored under *key*.
+    """
+    current = index.get(key[:-1])
+    if current is None or current.provider == key[-1]:
+        index[key[:-1]] = transform
@@ -10,8 +10,11 @@ Graph structure:
 
 from __future__ import annotations
 
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Concatenate, Literal, ParamSpec, TypeVar
 
 import networkx as nx
 from platformdirs import user_cache_dir
@@ -33,8 +36,27 @@ from neuromaps_prime.graph.transforms.volume import VolumeTransformOps
 from neuromaps_prime.graph.utils import GraphUtils
 from neuromaps_prime.niwrap import setup_runner
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
 NEUROMAPS_DATA_DIR = Path(user_cache_dir("neuromaps_prime"))
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _requires_build(  # noqa: UP047 (3.11 support)
+    method: Callable[Concatenate[NeuromapsGraph, _P], _R],
+) -> Callable[Concatenate[NeuromapsGraph, _P], _R]:
+    """Ensure a lazily-loaded graph is populated before running *method*."""
+
+    @functools.wraps(method)
+    def wrapper(self: NeuromapsGraph, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        self._ensure_built()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class NeuromapsGraph(nx.MultiDiGraph):
     """Multi-directed graph of brain template spaces and their transformations."""
@@ -51,6 +73,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
         yaml_file: Path | None = None,
         data_dir: Path = NEUROMAPS_DATA_DIR,
         *,
+        load: Literal["eager", "lazy", "background"] = "eager",
         _testing: bool = False,
         **kwargs,  # noqa: ANN003 (ignore annotation for kwargs)
     ) -> None:
@@ -65,6 +88,13 @@ class NeuromapsGraph(nx.MultiDiGraph):
                 bundled ``neuromaps_graph.yaml``.
             data_dir: Directory to save remote data. Defaults to system cache directory.
             verbose: Verbosity level (0=WARNING, 1=INFO, 2+=DEBUG)
+            load: When to populate the graph from its definition. ``'eager'``
+                builds during construction, ``'lazy'`` defers the build to the
+                first public lookup, search, or transformer call, and
+                ``'background'`` starts building on a worker thread so that
+                construction returns immediately; public methods wait for it.
+                Raw NetworkX accessors (e.g. ``nodes``) never trigger or wait
+                for a deferred build.
             _testing: When ``True``, skip YAML loading (for unit tests).
             **kwargs: Additional keyword arguments passed for runner setup.
         """
@@ -84,25 +114,61 @@ class NeuromapsGraph(nx.MultiDiGraph):
         self.data_dir = data_dir
         self.yaml_path = yaml_file
         self._cache = GraphCache()
+        self._transform_dispatch: dict[type, Callable[[Any], Edge]] = {
+            SurfaceTransform: self._register_surface_transform,
+            VolumeTransform: self._register_volume_transform,
+        }
         self.utils = GraphUtils(graph=self, cache=self._cache)
         self.surface_ops = SurfaceTransformOps(cache=self._cache, utils=self.utils)
         self.volume_ops = VolumeTransformOps(
             cache=self._cache, utils=self.utils, surface_ops=self.surface_ops
         )
         self._builder = GraphBuilder(cache=self._cache, data_dir=self.data_dir)
-        # Testing
-        if not _testing:
+        self._build_lock = threading.Lock()
+        self._build_future: Future[None] | None = None
+        self._built = _testing
+        match load:
+            case "eager":
+                self._ensure_built()
+            case "background":
+                pool = ThreadPoolExecutor(max_workers=1)
+                self._build_future = pool.submit(self._build)
+                pool.shutdown(wait=False)
+            case "lazy":
+                pass
+            case _:
+                raise ValueError(f"Invalid load mode: {load!r}")
+
+    def _ensure_built(self) -> None:
+        """Wait for or run the graph build; re-raises any build error."""
+        if self._built:
+            return
+        if self._build_future is not None:
+            self._build_future.result()
+            return
+        self._build()
+
+    def _build(self) -> None:
+        """Populate the graph from its definition exactly once."""
+        with self._build_lock:
+            if self._built:
+                return
             if self.yaml_path is not None:
                 self._builder.build_from_yaml(self, self.yaml_path)
             else:
                 # If no YAML path is provided build from default
                 # (tested through initialization in fixture)
                 self._builder.build_default(self)  # pragma: nocover
+            self._built = True
+            # Lookups made through the helpers before the build memoised an
+            # empty graph
+            self.clear_caches()
 
     # ------------------------------------------------------------------ #
     # Graph mutation                                                       #
     # ------------------------------------------------------------------ #
 
+    @_requires_build
     def add_transform(
         self, transform: SurfaceTransform | VolumeTransform, key: str
     ) -> None:
@@ -116,15 +182,20 @@ class NeuromapsGraph(nx.MultiDiGraph):
         Raises:
             TypeError: If transform is not a supported transform type.
         """
-        match transform:
-            case SurfaceTransform():
-                self._cache.add_surface_transform(transform)
-                edge = Edge(surface_transforms=[transform], volume_transforms=[])
-            case VolumeTransform():
-                self._cache.add_volume_transform(transform)
-                edge = Edge(surface_transforms=[], volume_transforms=[transform])
-            case _:
+        handler = self._transform_dispatch.get(type(transform))
+        if handler is None:
+            # Subclasses miss the exact-type lookup; resolve them via the MRO
+            handler = next(
+                (
+                    self._transform_dispatch[cls]
+                    for cls in type(transform).__mro__
+                    if cls in self._transform_dispatch
+                ),
+                None,
+            )
+            if handler is None:
                 raise TypeError(f"Unsupported transform type: {type(transform)}")
+        edge = handler(transform)
 
         self.add_edge(
             transform.source_space,
@@ -133,7 +204,19 @@ class NeuromapsGraph(nx.MultiDiGraph):
             data=edge,
             weight=transform.weight,
         )
+        self.clear_caches()
 
+    def _register_surface_transform(self, transform: SurfaceTransform) -> Edge:
+        """Cache a surface transform and return the edge data holding it."""
+        self._cache.add_surface_transform(transform)
+        return Edge(surface_transforms=[transform])
+
+    def _register_volume_transform(self, transform: VolumeTransform) -> Edge:
+        """Cache a volume transform and return the edge data holding it."""
+        self._cache.add_volume_transform(transform)
+        return Edge(volume_transforms=[transform])
+
+    @_requires_build
     def add_atlas(self, atlas: SurfaceAtlas | VolumeAtlas) -> None:
         """Register an atlas to a graph node and a cache entry.
 
@@ -161,10 +244,22 @@ class NeuromapsGraph(nx.MultiDiGraph):
             case VolumeAtlas():
                 node_data.volumes.append(atlas)
                 self._cache.add_volume_atlas(atlas)
+        self.clear_caches()
+
+    def clear_caches(self) -> None:
+        """Drop memoised paths, densities, compositions and projections.
+
+        :meth:`add_transform` and :meth:`add_atlas` call this themselves; call
+        it after mutating the graph or its resources by any other means.
+        """
+        self.utils.clear_caches()
+        self.surface_ops.clear_caches()
+        self.volume_ops.clear_caches()
 
     # ------------------------------------------------------------------ #
     # Validation                                                           #
     # ------------------------------------------------------------------ #
+    @_requires_build
     def validate_spaces(self, source: str, target: str) -> None:
         """Assert that both source and target exist as nodes in the graph.
 
@@ -181,11 +276,17 @@ class NeuromapsGraph(nx.MultiDiGraph):
     # Path finding                                                         #
     # ------------------------------------------------------------------ #
 
+    @_requires_build
     def find_path(
         self, source: str, target: str, edge_type: str | None = None
     ) -> list[str]:
         """Find the shortest weighted path between two spaces.
 
+        Paths are served from :class:`GraphUtils` lookup tables, which are
+        cleared by :meth:`add_transform`, :meth:`add_atlas` and
+        :meth:`clear_caches`. Call :meth:`clear_caches` after adding or
+        removing edges by any other means.
+
         Args:
             source: Source space name.
             target: Target space name.
@@ -194,6 +295,9 @@ class NeuromapsGraph(nx.MultiDiGraph):
 
         Returns:
             Ordered list of space names, or an empty list when no path exists.
+
+        Raises:
+            networkx.NodeNotFound: If *source* or *target* is not in the graph.
         """
         return self.utils.find_path(source, target, edge_type)
 
@@ -201,6 +305,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
     # Resource fetching                                                    #
     # ------------------------------------------------------------------ #
 
+    @_requires_build
     def fetch_surface_atlas(
         self,
         space: str,
@@ -227,6 +332,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             resource_type=resource_type,
         )
 
+    @_requires_build
     def fetch_volume_atlas(
         self, space: str, resolution: str, resource_type: str
     ) -> VolumeAtlas | None:
@@ -247,6 +353,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             resource_type=resource_type,
         )
 
+    @_requires_build
     def fetch_surface_to_surface_transform(
         self,
         source: str,
@@ -280,6 +387,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             provider=provider,
         )
 
+    @_requires_build
     def fetch_volume_to_volume_transform(
         self,
         source: str,
@@ -310,6 +418,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             provider=provider,
         )
 
+    @_requires_build
     def fetch_surface_annotation(
         self, space: str, label: str, density: str, hemisphere: Literal["left", "right"]
     ) -> SurfaceAnnotation | None:
@@ -329,6 +438,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             space=space, label=label, density=density, hemisphere=hemisphere
         )
 
+    @_requires_build
     def fetch_volume_annotation(
         self, space: str, label: str, resolution: str
     ) -> VolumeAnnotation | None:
@@ -351,6 +461,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
     # Search                                                               #
     # ------------------------------------------------------------------ #
 
+    @_requires_build
     def search_surface_atlases(
         self,
         space: str,
@@ -377,6 +488,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             resource_type=resource_type,
         )
 
+    @_requires_build
     def search_surface_transforms(
         self,
         source_space: str,
@@ -406,6 +518,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             resource_type=resource_type,
         )
 
+    @_requires_build
     def search_volume_atlases(
         self,
         space: str,
@@ -428,6 +541,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             space=space, resolution=resolution, resource_type=resource_type
         )
 
+    @_requires_build
     def search_volume_transforms(
         self,
         source_space: str,
@@ -458,6 +572,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
     # Density helpers                                                      #
     # ------------------------------------------------------------------ #
 
+    @_requires_build
     def find_common_density(self, mid_space: str, target_space: str) -> str:
         """Find the highest density shared between mid_space and target_space.
 
@@ -473,6 +588,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
         """
         return self.utils.find_common_density(mid_space, target_space)
 
+    @_requires_build
     def find_highest_density(self, space: str) -> str:
         """Return the highest surface density available for space.
 
@@ -491,6 +607,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
     # Node introspection                                                   #
     # ------------------------------------------------------------------ #
 
+    @_requires_build
     def get_node_data(self, node_name: str) -> Node:
         """Return the :class:`~neuromaps_prime.graph.models.Node` for node_name.
 
@@ -509,6 +626,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
     # Transformers                                                         #
     # ------------------------------------------------------------------ #
 
+    @_requires_build
     def surface_to_surface_transformer(
         self,
         transformer_type: Literal["metric", "label"],
@@ -561,6 +679,28 @@ class NeuromapsGraph(nx.MultiDiGraph):
             provider=provider,
         )
 
+    @_requires_build
+    def surface_to_surface_transformer_batch(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+        max_workers: int | None = None,
+    ) -> list[Path | None]:
+        """Run several surface-to-surface resamplings concurrently.
+
+        Args:
+            requests: Keyword arguments for each
+                :meth:`surface_to_surface_transformer` call. Output file paths
+                must be distinct.
+            max_workers: Thread pool size. Defaults to the executor default.
+
+        Returns:
+            The result of each request, in the same order as *requests*.
+        """
+        return self.surface_ops.transform_surface_batch(
+            requests=requests, max_workers=max_workers
+        )
+
+    @_requires_build
     def surface_to_volume_transformer(
         self,
         transformer_type: Literal["metric", "label"],
@@ -615,6 +755,7 @@ class NeuromapsGraph(nx.MultiDiGraph):
             provider=provider,
         )
 
+    @_requires_build
     def volume_to_volume_transformer(
         self,
         input_file: Path,
@@ -661,6 +802,28 @@ class NeuromapsGraph(nx.MultiDiGraph):
             provider=provider,
         )
 
+    @_requires_build
+    def volume_to_volume_transformer_batch(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+        max_workers: int | None = None,
+    ) -> list[Path]:
+        """Run several volume-to-volume warps concurrently.
+
+        Args:
+            requests: Keyword arguments for each
+                :meth:`volume_to_volume_transformer` call. Output file paths
+                must be distinct.
+            max_workers: Thread pool size. Defaults to the executor default.
+
+        Returns:
+            The result of each request, in the same order as *requests*.
+        """
+        return self.volume_ops.transform_volume_batch(
+            requests=requests, max_workers=max_workers
+        )
+
+    @_requires_build
     def volume_to_surface_transformer(
         self,
         transformer_type: Literal["metric", "label"],
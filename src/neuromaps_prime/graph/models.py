@@ -1,17 +1,24 @@
 """Models for resources in the neuromaps_prime graph."""
 
 import logging
+import sys
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
-from neuromaps_prime.fetcher import download_and_validate
+from neuromaps_prime.fetcher import download_and_validate, download_lock
 
 _logger = logging.getLogger(__name__)
 
 
+def _lower_hemisphere(value: object) -> object:
+    """Normalise hemisphere strings to interned lowercase before validation."""
+    return sys.intern(value.lower()) if isinstance(value, str) else value
+
+
 class Resource(BaseModel):
     """Base model for resources in the neuromaps_prime graph."""
 
@@ -22,6 +29,38 @@ class Resource(BaseModel):
     references: Sequence[str | dict[str, str]] | None = None
     notes: Sequence[str] | None = None
 
+    @field_validator(
+        "space",
+        "source_space",
+        "target_space",
+        "density",
+        "resolution",
+        "resource_type",
+        "label",
+        "provider",
+        check_fields=False,
+    )
+    @classmethod
+    def _intern_keys(cls, value: str) -> str:
+        """Intern cache-key fields so repeated values share one string."""
+        return sys.intern(value)
+
+    @classmethod
+    def unchecked(cls, **fields: Any) -> Self:  # noqa: ANN401
+        """Construct a resource without running validation.
+
+        For trusted values only, e.g. fields copied from validated resources or
+        a file just written by Workbench: no type coercion, hemisphere
+        normalisation or key interning is applied.
+
+        Args:
+            **fields: Field values, already in their validated form.
+
+        Returns:
+            The constructed resource.
+        """
+        return cls.model_construct(**fields)
+
     def fetch(self) -> Path:
         """Return the path to this resource's file, downloading if necessary.
 
@@ -38,10 +77,13 @@ class Resource(BaseModel):
         if (local_file := Path(self.uri)).exists():
             self.file_path = local_file
         else:
-            _logger.info(f"Fetching {self.file_path.name} from remote server.")
-            download_and_validate(uri=self.uri, dest=self.file_path)
-            if not self.file_path.exists():
-                raise FileNotFoundError("File does not exist.")
+            with download_lock(self.file_path):
+                # Another thread may have finished this download while we waited
+                if not self.file_path.exists():
+                    _logger.info(f"Fetching {self.file_path.name} from remote server.")
+                    download_and_validate(uri=self.uri, dest=self.file_path)
+                    if not self.file_path.exists():
+                        raise FileNotFoundError("File does not exist.")
         return self.file_path
 
     def __repr__(self) -> str:
@@ -57,6 +99,10 @@ class SurfaceAtlas(Resource):
     hemisphere: Literal["left", "right"]
     resource_type: str
 
+    normalise_hemisphere = field_validator("hemisphere", mode="before")(
+        _lower_hemisphere
+    )
+
 
 class SurfaceTransform(Resource):
     """Model for surface transform resources."""
@@ -69,6 +115,10 @@ class SurfaceTransform(Resource):
     provider: str
     weight: float = 1.0
 
+    normalise_hemisphere = field_validator("hemisphere", mode="before")(
+        _lower_hemisphere
+    )
+
 
 class SurfaceAnnotation(Resource):
     """Model for surface annotation."""
@@ -79,6 +129,10 @@ class SurfaceAnnotation(Resource):
     density: str
     hemisphere: Literal["left", "right"]
 
+    normalise_hemisphere = field_validator("hemisphere", mode="before")(
+        _lower_hemisphere
+    )
+
 
 class VolumeAtlas(Resource):
     """Model for volume atlas resources."""
@@ -121,6 +175,13 @@ class Node(BaseModel):
     volume_annotations: Sequence[VolumeAnnotation] = Field(default_factory=list)
 
     def __repr__(self) -> str:
+        """Short representation; see ``str()`` for the full resource listing."""
+        return (
+            f"Node(name={self.name!r}, surfaces={len(self.surfaces)}, "
+            f"volumes={len(self.volumes)})"
+        )
+
+    def __str__(self) -> str:
         """String representation."""
         surface_str = "\n".join(s.name for s in self.surfaces)
         volume_str = "\n".join(v.name for v in self.volumes)
@@ -138,13 +199,21 @@ class Node(BaseModel):
         )
 
 
-class Edge(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Edge:
     """Edge representation in transformation graph."""
 
-    surface_transforms: Sequence[SurfaceTransform] = Field(default_factory=list)
-    volume_transforms: Sequence[VolumeTransform] = Field(default_factory=list)
+    surface_transforms: Sequence[SurfaceTransform] = field(default_factory=list)
+    volume_transforms: Sequence[VolumeTransform] = field(default_factory=list)
 
     def __repr__(self) -> str:
+        """Short representation; see ``str()`` for the full transform listing."""
+        return (
+            f"Edge(surface_transforms={len(self.surface_transforms)}, "
+            f"volume_transforms={len(self.volume_transforms)})"
+        )
+
+    def __str__(self) -> str:
         """String representation."""
         surface_str = "\n".join(s.name for s in self.surface_transforms)
         volume_str = "\n".join(v.name for v in self.volume_transforms)
@@ -7,16 +7,19 @@ transformations. All resource lookups go through GraphCache directly.
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from niwrap import workbench
-from pydantic import BaseModel, PrivateAttr
 
-from neuromaps_prime.graph.cache import GraphCache  # noqa: TC001 (pydantic req'd)
-from neuromaps_prime.graph.models import SurfaceTransform
-from neuromaps_prime.graph.utils import GraphUtils  # noqa: TC001 (pydantic req'd)
+from neuromaps_prime.fetcher import _prefetch
+from neuromaps_prime.graph.models import SurfaceAtlas, SurfaceTransform
 from neuromaps_prime.transforms.surface import (
+    copy_unchanged,
     label_resample,
     metric_resample,
     surface_sphere_project_unproject,
@@ -27,15 +30,22 @@ from neuromaps_prime.transforms.utils import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+
+    from neuromaps_prime.graph.cache import GraphCache
+    from neuromaps_prime.graph.utils import GraphUtils
 
 # Experimental transformations that should throw a warning; only need to list one way
 EXPERIMENTAL_XFMS: list[tuple[list[str], str | None]] = [
     (["NMT2Sym", "MBM"], "macaque_marmoset")
 ]
 
+# Concurrent downloads of the resources along a multi-hop path
+_HOP_FETCH_WORKERS = 4
+
 
-class SurfaceTransformOps(BaseModel):
+@dataclass
+class SurfaceTransformOps:
     """Surface-to-surface transformation operations.
 
     Orchestrates single-hop fetches, multi-hop composition, and
@@ -51,21 +61,34 @@ class SurfaceTransformOps(BaseModel):
             the graph.
     """
 
-    model_config = {"arbitrary_types_allowed": True}
-
     cache: GraphCache
     utils: GraphUtils
     surface_to_surface_key: str = "surface_to_surface"
-    experimental_xfms: list[tuple[list[str], str | None]] | None = EXPERIMENTAL_XFMS
-    _logger: logging.Logger = PrivateAttr()
-
-    def model_post_init(self, __context: Any) -> None:  # noqa: ANN401
+    experimental_xfms: list[tuple[list[str], str | None]] | None = field(
+        default_factory=EXPERIMENTAL_XFMS.copy
+    )
+    _logger: logging.Logger = field(init=False, repr=False)
+    _composed: dict[
+        tuple[str, str, str, str, str | None, Path, bool], SurfaceTransform
+    ] = field(default_factory=dict, init=False, repr=False)
+    _compose_locks: dict[tuple[Path, str, str, str], threading.Lock] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _compose_locks_guard: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
         """Post initialization steps.
 
         Lazily grab logger from Graph initialization.
         """
         self._logger = logging.getLogger("neuromaps-PRIME")
 
+    def clear_caches(self) -> None:
+        """Drop memoised multi-hop compositions; call after adding edges."""
+        self._composed.clear()
+
     # ------------------------------------------------------------------ #
     # Surface-to-surface                                                 #
     # ------------------------------------------------------------------ #
@@ -91,6 +114,9 @@ class SurfaceTransformOps(BaseModel):
           1. Resolve/compose the sphere-to-sphere transform.
           2. Resample the data file using area-corrected interpolation.
 
+        When source and target share both space and density, the input is
+        copied to output_file_path without resampling.
+
         Args:
             transformer_type: ``'metric'`` or ``'label'``.
             input_file: Input GIFTI file to resample.
@@ -128,6 +154,20 @@ class SurfaceTransformOps(BaseModel):
 
         source_density = source_density or estimate_surface_density(input_file)
 
+        # Identity transform: nothing to resample, so skip the workbench call
+        if source_space == target_space:
+            target_density = target_density or self.utils.find_highest_density(
+                space=target_space
+            )
+            if source_density == target_density:
+                return copy_unchanged(
+                    input_file,
+                    output_file_path,
+                    workbench.LABEL_RESAMPLE_METADATA
+                    if transformer_type == "label"
+                    else workbench.METRIC_RESAMPLE_METADATA,
+                )
+
         sphere_transform = self._resolve_sphere_transform(
             source=source_space,
             target=target_space,
@@ -144,32 +184,28 @@ class SurfaceTransformOps(BaseModel):
             space=target_space
         )
 
-        new_sphere = self.cache.require_surface_atlas(
-            space=target_space,
-            density=target_density,
-            hemisphere=hemisphere,
-            resource_type="sphere",
-        ).fetch()
-
-        current_area = self.cache.require_surface_atlas(
-            space=source_space,
-            density=source_density,
-            hemisphere=hemisphere,
-            resource_type=area_resource,
-        ).fetch()
-
-        new_area = self.cache.require_surface_atlas(
-            space=target_space,
-            density=target_density,
-            hemisphere=hemisphere,
-            resource_type=area_resource,
-        ).fetch()
+        atlases = [
+            self.cache.require_surface_atlas(
+                space=space,
+                density=density,
+                hemisphere=hemisphere,
+                resource_type=resource_type,
+            )
+            for space, density, resource_type in (
+                (target_space, target_density, "sphere"),
+                (source_space, source_density, area_resource),
+                (target_space, target_density, area_resource),
+            )
+        ]
+        current_sphere, new_sphere, current_area, new_area = _prefetch(
+            [sphere_transform, *atlases]
+        )
 
         match transformer_type:
             case "label":
                 return label_resample(
                     input_file_path=input_file,
-                    current_sphere=sphere_transform.fetch(),
+                    current_sphere=current_sphere,
                     new_sphere=new_sphere,
                     method="ADAP_BARY_AREA",
                     area_surfs={"current-area": current_area, "new-area": new_area},
@@ -178,13 +214,41 @@ class SurfaceTransformOps(BaseModel):
             case "metric":
                 return metric_resample(
                     input_file_path=input_file,
-                    current_sphere=sphere_transform.fetch(),
+                    current_sphere=current_sphere,
                     new_sphere=new_sphere,
                     method="ADAP_BARY_AREA",
                     area_surfs={"current-area": current_area, "new-area": new_area},
                     output_file_path=output_file_path,
                 ).metric_out
 
+    def transform_surface_batch(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+        max_workers: int | None = None,
+    ) -> list[Path | None]:
+        """Run several :meth:`transform_surface` calls concurrently.
+
+        Each resampling shells out to Workbench, so independent requests are
+        run on a thread pool. Multi-hop compositions are memoised, and only
+        those writing the same intermediate files wait for one another, so
+        requests sharing a path compose it only once.
+
+        Args:
+            requests: Keyword arguments for each :meth:`transform_surface`
+                call. Output file paths must be distinct.
+            max_workers: Thread pool size. Defaults to the executor default.
+
+        Returns:
+            The result of each request, in the same order as *requests*.
+        """
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.transform_surface, **request) for request in requests
+            ]
+            return [future.result() for future in futures]
+
     def transform_surface_to_volume(
         self,
         transformer_type: Literal["metric", "label"],
@@ -336,6 +400,26 @@ class SurfaceTransformOps(BaseModel):
         if source == target:
             raise ValueError(f"Source and target spaces are the same: '{source}'")
 
+        # Graph neighbours resolve with a dict hit instead of a path search.
+        # Composed multi-hop spheres are cached but never become graph edges,
+        # so they still go through the memoised composition below.
+        if self.utils.graph.has_edge(source, target, key=self.surface_to_surface_key):
+            direct = self.cache.get_surface_transform(
+                source=source,
+                target=target,
+                density=density,
+                hemisphere=hemisphere,
+                resource_type="sphere",
+                provider=provider,
+            )
+            if direct is not None:
+                self._experimental_warn(
+                    paths=[source, target],
+                    spaces=self.experimental_xfms,
+                    provider=provider,
+                )
+                return direct
+
         path = self.utils.find_path(
             source=source, target=target, edge_type=self.surface_to_surface_key
         )
@@ -348,23 +432,34 @@ class SurfaceTransformOps(BaseModel):
         )
 
         if len(path) == 2:
-            return self.cache.get_surface_transform(
-                source=source,
-                target=target,
-                density=density,
-                hemisphere=hemisphere,
-                resource_type="sphere",
-                provider=provider,
-            )
+            # Neighbours, but no transform registered at this density
+            return None
 
-        return self._compose_multihop(
-            path=path,
-            density=density,
-            hemisphere=hemisphere,
-            output_file_path=output_file_path,
-            add_edge=add_edge,
-            provider=provider,
+        # Reuse an earlier composition written to the same directory, with the
+        # same registration, while its output sphere is still on disk; compose
+        # under a lock shared only by callers whose hop files would collide
+        parent_dir = Path(output_file_path).parent
+        memo_key = (
+            source,
+            target,
+            density,
+            hemisphere,
+            provider,
+            parent_dir,
+            add_edge,
         )
+        with self._compose_lock(parent_dir, source, density, hemisphere):
+            composed = self._composed.get(memo_key)
+            if composed is None or not composed.file_path.exists():
+                composed = self._composed[memo_key] = self._compose_multihop(
+                    path=path,
+                    density=density,
+                    hemisphere=hemisphere,
+                    output_file_path=output_file_path,
+                    add_edge=add_edge,
+                    provider=provider,
+                )
+        return composed
 
     # ------------------------------------------------------------------ #
     # Multi-hop composition                                                #
@@ -410,19 +505,51 @@ class SurfaceTransformOps(BaseModel):
                 f"No surface transform found from '{path[0]}' to '{path[1]}'"
             )
 
-        for hop_idx, next_space in enumerate(path[2:], start=2):
-            current_transform = self._compose_next_hop(
-                path=path,
-                hop_idx=hop_idx,
-                next_space=next_space,
-                current_transform=current_transform,
-                source=path[0],
-                density=density,
+        # Resolve every hop up front so a gap later in the path fails before
+        # any Workbench composition runs
+        hop_resources = [
+            self._resolve_hop(
+                mid_space=path[hop_idx - 1],
+                target_space=path[hop_idx],
                 hemisphere=hemisphere,
-                output_file_path=output_file_path,
-                add_edge=add_edge,
                 provider=provider,
             )
+            for hop_idx in range(2, len(path))
+        ]
+
+        parent_dir = Path(output_file_path).parent
+        hemi_letter = hemisphere[0].upper()
+        composed: list[SurfaceTransform] = []
+        # Download every hop's inputs up front so the fetches overlap each
+        # other and the Workbench runs of earlier hops; each resource is
+        # fetched once even when hops share it
+        resources = {
+            id(resource): resource
+            for resource in (current_transform, *chain.from_iterable(hop_resources))
+        }
+        with ThreadPoolExecutor(max_workers=_HOP_FETCH_WORKERS) as pool:
+            fetched = {key: pool.submit(r.fetch) for key, r in resources.items()}
+            for hop_idx, next_space in enumerate(path[2:], start=2):
+                hop = hop_resources[hop_idx - 2]
+                for resource in (current_transform, *hop):
+                    if (future := fetched.get(id(resource))) is not None:
+                        future.result()
+                current_transform = self._compose_next_hop(
+                    path=path,
+                    hop_idx=hop_idx,
+                    next_space=next_space,
+                    current_transform=current_transform,
+                    source=path[0],
+                    density=density,
+                    hemisphere=hemisphere,
+                    parent_dir=parent_dir,
+                    hemi_letter=hemi_letter,
+                    provider=provider,
+                    hop_resources=hop,
+                )
+                composed.append(current_transform)
+        if add_edge:
+            self.cache.add_surface_transforms(composed)
 
         return current_transform
 
@@ -435,13 +562,17 @@ class SurfaceTransformOps(BaseModel):
         source: str,
         density: str,
         hemisphere: Literal["left", "right"],
-        output_file_path: str,
+        parent_dir: Path,
+        hemi_letter: str,
         *,
-        add_edge: bool,
         provider: str | None = None,
+        hop_resources: tuple[SurfaceAtlas, SurfaceTransform] | None = None,
     ) -> SurfaceTransform:
         """Extend current_transform by one hop towards next_space.
 
+        The new transform is built without validation: its fields come from
+        already-validated inputs and its file was just written by Workbench.
+
         Args:
             path: Full transformation path.
             hop_idx: Current position in path (2-based).
@@ -450,19 +581,21 @@ class SurfaceTransformOps(BaseModel):
             source: Original source space (used for naming).
             density: Surface mesh density.
             hemisphere: ``'left'`` or ``'right'``.
-            output_file_path: Base path for output files.
-            add_edge: Whether to register the new transform.
+            parent_dir: Directory for the intermediate sphere file.
+            hemi_letter: Hemisphere initial used in file names (``'L'``/``'R'``).
             provider: Optional provider name for intermediate lookups.
+            hop_resources: Pre-resolved ``(mid_atlas, unproject_transform)``
+                for this hop. Resolved from the cache when ``None``.
 
         Returns:
             New :class:`SurfaceTransform` from source to next_space.
         """
         hop_output = self._hop_output_path(
-            output_file_path=output_file_path,
+            parent_dir=parent_dir,
             source=source,
             next_target=next_space,
             density=density,
-            hemisphere=hemisphere,
+            hemi_letter=hemi_letter,
         )
         composed_path = self._two_hops(
             source_space=path[hop_idx - 2],
@@ -473,23 +606,22 @@ class SurfaceTransformOps(BaseModel):
             output_file_path=hop_output,
             first_transform=current_transform,
             provider=provider,
+            hop_resources=hop_resources,
         )
-        new_transform = SurfaceTransform(
-            name=f"{source}_to_{next_space}_{density}_{hemisphere}_sphere",
+        # Unchecked construction skips the model's hemisphere normalisation
+        hemi = hemisphere.lower()
+        return SurfaceTransform.unchecked(
+            name=f"{source}_to_{next_space}_{density}_{hemi}_sphere",
             description=f"Surface transform from '{source}' to '{next_space}'",
             source_space=source,
             target_space=next_space,
             density=density,
-            hemisphere=hemisphere,
+            hemisphere=hemi,
             resource_type="sphere",
             file_path=composed_path,
             weight=float(hop_idx),
             provider=provider or "",
         )
-        if add_edge:
-            self.cache.add_surface_transform(new_transform)
-
-        return new_transform
 
     def _two_hops(
         self,
@@ -501,6 +633,7 @@ class SurfaceTransformOps(BaseModel):
         output_file_path: str,
         first_transform: SurfaceTransform | None = None,
         provider: str | None = None,
+        hop_resources: tuple[SurfaceAtlas, SurfaceTransform] | None = None,
     ) -> Path:
         """Compose two sphere transforms via project-unproject through mid_space.
 
@@ -515,6 +648,8 @@ class SurfaceTransformOps(BaseModel):
                 cache when ``None``.
             provider: Optional provider name. Falls back to the first
                 registered provider when ``None``.
+            hop_resources: Pre-resolved ``(mid_atlas, unproject_transform)``.
+                Resolved from the cache when ``None``.
 
         Returns:
             Path to the composed output sphere file.
@@ -540,8 +675,46 @@ class SurfaceTransformOps(BaseModel):
                 f"{mid_space!r}; falling back to {first_transform.provider!r}. The "
                 "composed transform will use mixed providers.",
             )
-        sphere_in = first_transform.fetch()
 
+        # Resolve every resource before fetching so a missing density, atlas or
+        # transform fails fast without downloading anything
+        mid_atlas, unproject_transform = hop_resources or self._resolve_hop(
+            mid_space=mid_space,
+            target_space=target_space,
+            hemisphere=hemisphere,
+            provider=provider,
+        )
+
+        return surface_sphere_project_unproject(
+            sphere_in=first_transform.fetch(),
+            sphere_project_to=mid_atlas.fetch(),
+            sphere_unproject_from=unproject_transform.fetch(),
+            sphere_out=output_file_path,
+        ).sphere_out
+
+    def _resolve_hop(
+        self,
+        mid_space: str,
+        target_space: str,
+        hemisphere: Literal["left", "right"],
+        provider: str | None = None,
+    ) -> tuple[SurfaceAtlas, SurfaceTransform]:
+        """Resolve the mid-space sphere and mid-to-target transform of a hop.
+
+        Args:
+            mid_space: Intermediate space name.
+            target_space: Target space name.
+            hemisphere: ``'left'`` or ``'right'``.
+            provider: Optional provider name. Falls back to the first
+                registered provider when ``None``.
+
+        Returns:
+            ``(mid_atlas, unproject_transform)`` at the highest density the
+            two share.
+
+        Raises:
+            ValueError: If no common density, atlas or transform exists.
+        """
         common_density = self.utils.find_common_density(mid_space, target_space)
         mid_atlas = self.cache.get_surface_atlas(
             space=mid_space,
@@ -553,7 +726,6 @@ class SurfaceTransformOps(BaseModel):
             raise ValueError(
                 f"No sphere atlas found for '{mid_space}' at density '{common_density}'"
             )
-        sphere_project_to = mid_atlas.fetch()
 
         unproject_transform = self.cache.get_surface_transform(
             source=mid_space,
@@ -573,48 +745,59 @@ class SurfaceTransformOps(BaseModel):
                 f"{target_space!r}; falling back to {unproject_transform.provider!r}. "
                 "The composed transform will use mixed providers.",
             )
-        sphere_unproject_from = unproject_transform.fetch()
-
-        return surface_sphere_project_unproject(
-            sphere_in=sphere_in,
-            sphere_project_to=sphere_project_to,
-            sphere_unproject_from=sphere_unproject_from,
-            sphere_out=output_file_path,
-        ).sphere_out
+        return mid_atlas, unproject_transform
 
     # ------------------------------------------------------------------ #
     # Private helpers                                                      #
     # ------------------------------------------------------------------ #
 
+    def _compose_lock(
+        self, parent_dir: Path, source: str, density: str, hemisphere: str
+    ) -> threading.Lock:
+        """Return the lock guarding compositions that write the same hop files.
+
+        Args:
+            parent_dir: Directory the intermediate spheres are written to.
+            source: Original source space name.
+            density: Surface mesh density.
+            hemisphere: ``'left'`` or ``'right'``.
+
+        Returns:
+            The same lock for every call naming the same hop files.
+        """
+        key = (parent_dir, source, density, hemisphere.lower())
+        with self._compose_locks_guard:
+            return self._compose_locks.setdefault(key, threading.Lock())
+
     def _hop_output_path(
         self,
-        output_file_path: str,
+        parent_dir: Path,
         source: str,
         next_target: str,
         density: str,
-        hemisphere: Literal["left", "right"],
+        hemi_letter: str,
     ) -> str:
         """Build a deterministic intermediate file path for a single hop.
 
         Args:
-            output_file_path: Final output path (parent directory is reused).
+            parent_dir: Directory of the final output, computed once per
+                composition.
             source: Original source space name.
             next_target: Space being reached in this hop.
             density: Surface mesh density.
-            hemisphere: ``'left'`` or ``'right'``.
+            hemi_letter: Hemisphere initial (``'L'`` or ``'R'``).
 
         Returns:
-            Absolute path string for the intermediate sphere file.
+            Path string for the intermediate sphere file.
         """
-        parent = Path(output_file_path).parent
         fname = (
             f"src-{source}_"
             f"to-{next_target}_"
             f"den-{density}_"
-            f"hemi-{hemisphere[0].upper()}_"
+            f"hemi-{hemi_letter}_"
             f"sphere.surf.gii"
         )
-        return str(parent / fname)
+        return str(parent_dir / fname)
 
     def _experimental_warn(
         self,
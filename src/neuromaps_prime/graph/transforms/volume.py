@@ -6,24 +6,27 @@ pipeline. All resource lookups go through GraphCache directly.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from niwrap import workbench
-from pydantic import BaseModel
 
-from neuromaps_prime.graph.cache import GraphCache  # noqa: TC001 (pydantic req'd)
-from neuromaps_prime.graph.transforms.surface import (
-    SurfaceTransformOps,  # noqa: TC001 (pydantic req'd)
-)
-from neuromaps_prime.graph.utils import GraphUtils  # noqa: TC001 (pydantic req'd)
+from neuromaps_prime.fetcher import _prefetch
 from neuromaps_prime.transforms.utils import validate_volume_file
 from neuromaps_prime.transforms.volume import surface_project, vol_to_vol
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Mapping, Sequence
 
+    from neuromaps_prime.graph.cache import GraphCache
+    from neuromaps_prime.graph.transforms.surface import SurfaceTransformOps
+    from neuromaps_prime.graph.utils import GraphUtils
 
-class VolumeTransformOps(BaseModel):
+
+@dataclass
+class VolumeTransformOps:
     """Volume-to-volume and volume-to-surface transformation operations.
 
     Attributes:
@@ -36,12 +39,17 @@ class VolumeTransformOps(BaseModel):
             graph.
     """
 
-    model_config = {"arbitrary_types_allowed": True}
-
     cache: GraphCache
     utils: GraphUtils
     surface_ops: SurfaceTransformOps
     volume_to_volume_key: str = "volume_to_volume"
+    _projected: dict[tuple[Any, ...], Path] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def clear_caches(self) -> None:
+        """Drop memoised volume-to-surface projections."""
+        self._projected.clear()
 
     # ------------------------------------------------------------------ #
     # Volume-to-volume                                                     #
@@ -117,6 +125,33 @@ class VolumeTransformOps(BaseModel):
             interp_params=interp_params,
         )
 
+    def transform_volume_batch(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+        max_workers: int | None = None,
+    ) -> list[Path]:
+        """Run several :meth:`transform_volume` calls concurrently.
+
+        Each warp shells out to ANTs, so independent requests are run on a
+        thread pool. ANTs is itself multi-threaded; leave headroom by keeping
+        *max_workers* below the core count for large volumes.
+
+        Args:
+            requests: Keyword arguments for each :meth:`transform_volume` call.
+                Output file paths must be distinct.
+            max_workers: Thread pool size. Defaults to the executor default.
+
+        Returns:
+            The result of each request, in the same order as *requests*.
+        """
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.transform_volume, **request) for request in requests
+            ]
+            return [future.result() for future in futures]
+
     # ------------------------------------------------------------------ #
     # Volume-to-surface                                                    #
     # ------------------------------------------------------------------ #
@@ -219,6 +254,10 @@ class VolumeTransformOps(BaseModel):
     ) -> Path:
         """Ribbon-constrained projection of input_file onto the surface.
 
+        Projections are memoised on the input file's identity and contents
+        (resolved path, size and modification time) plus the projection
+        settings, and reused while the projected file still exists.
+
         Args:
             transformer_type: ``'metric'`` or ``'label'`` — determines the
                 output file extension.
@@ -234,25 +273,30 @@ class VolumeTransformOps(BaseModel):
         Raises:
             ValueError: If any required surface atlas is missing.
         """
-        source_surface = self.cache.require_surface_atlas(
+        stat = Path(input_file).stat()
+        memo_key = (
+            Path(input_file).resolve(),
+            stat.st_mtime_ns,
+            stat.st_size,
+            source_space,
+            source_density,
+            hemisphere,
+            area_resource,
+            transformer_type,
+        )
+        if (projected := self._projected.get(memo_key)) and projected.exists():
+            return projected
+
+        atlases = self.cache.require_surface_atlases(
             space=source_space,
             density=source_density,
             hemisphere=hemisphere,
-            resource_type=area_resource,
-        ).fetch()
-
-        ribbon = {
-            surf_type: self.cache.require_surface_atlas(
-                space=source_space,
-                density=source_density,
-                hemisphere=hemisphere,
-                resource_type=surf_type,
-            ).fetch()
-            for surf_type in ("white", "pial")
-        }
+            resource_types=(area_resource, "white", "pial"),
+        )
+        surfaces = dict(zip(atlases, _prefetch(list(atlases.values())), strict=True))
 
         ribbon_surfs = workbench.volume_to_surface_mapping_ribbon_constrained(
-            inner_surf=ribbon["white"], outer_surf=ribbon["pial"]
+            inner_surf=surfaces["white"], outer_surf=surfaces["pial"]
         )
         ext = "func" if transformer_type == "metric" else "label"
         out_fpath = (
@@ -261,9 +305,10 @@ class VolumeTransformOps(BaseModel):
             f"hemi-{hemisphere}_"
             f"desc-volume_annot.{ext}.gii"
         )
-        return surface_project(
+        projected = self._projected[memo_key] = surface_project(
             volume=input_file,
-            surface=source_surface,
+            surface=surfaces[area_resource],
             ribbon_surfs=ribbon_surfs,
             out_fpath=out_fpath,
         )
+        return projected
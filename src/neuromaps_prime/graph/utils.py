@@ -6,18 +6,25 @@ utilities that operate on the NetworkX graph structure.
 
 from __future__ import annotations
 
+import heapq
+from collections import Counter
+from itertools import count
 from typing import Any
 
 import networkx as nx
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from neuromaps_prime.graph.cache import GraphCache  # noqa: TC001 (pydantic req'd)
-from neuromaps_prime.transforms.utils import _get_density_key
 
 
 class GraphUtils(BaseModel):
     """Graph traversal, validation, and introspection utilities.
 
+    Shortest paths and density lookups are memoised. Density results are
+    dropped whenever the cache changes, but path tables are only dropped by
+    :meth:`clear_caches`, so call it after adding or removing graph edges
+    directly rather than through :meth:`NeuromapsGraph.add_transform`.
+
     Attributes:
         graph: The underlying NetworkX :class:`~networkx.MultiDiGraph`.
         cache: The :class:`GraphCache` instance used for resource lookups.
@@ -27,6 +34,23 @@ class GraphUtils(BaseModel):
 
     graph: nx.MultiDiGraph
     cache: GraphCache
+    _path_tables: dict[str | None, dict[str, dict[str, list[str]]]] = PrivateAttr(
+        default_factory=dict
+    )
+    _density_memo: dict[tuple[str, ...], str] = PrivateAttr(default_factory=dict)
+    _density_memo_version: int = PrivateAttr(default=-1)
+
+    def clear_caches(self) -> None:
+        """Drop memoised graph queries; call after mutating graph edges."""
+        self._path_tables.clear()
+        self._density_memo.clear()
+
+    def _density_results(self) -> dict[tuple[str, ...], str]:
+        """Return the density memo, emptied if the cache changed since filled."""
+        if self._density_memo_version != self.cache.version:
+            self._density_memo.clear()
+            self._density_memo_version = self.cache.version
+        return self._density_memo
 
     # ------------------------------------------------------------------ #
     # Validation                                                           #
@@ -42,16 +66,15 @@ class GraphUtils(BaseModel):
         Raises:
             ValueError: If either space is absent from the graph.
         """
-        nodes = set(self.graph.nodes)
-        if source not in nodes:
+        if source not in self.graph:
             raise ValueError(
                 f"Source space '{source}' does not exist in the graph."
-                f" Available spaces: {sorted(nodes)}"
+                f" Available spaces: {sorted(self.graph.nodes)}"
             )
-        if target not in nodes:
+        if target not in self.graph:
             raise ValueError(
                 f"Target space '{target}' does not exist in the graph."
-                f" Available spaces: {sorted(nodes)}"
+                f" Available spaces: {sorted(self.graph.nodes)}"
             )
 
     # ------------------------------------------------------------------ #
@@ -63,6 +86,11 @@ class GraphUtils(BaseModel):
     ) -> list[str]:
         """Find the shortest weighted path between two spaces.
 
+        The graph of template spaces is small but queried repeatedly, so all
+        shortest paths from *source* for each *edge_type* are computed on
+        first use and served from a lookup table until :meth:`clear_caches`
+        is called.
+
         Args:
             source: Source space name.
             target: Target space name.
@@ -72,27 +100,35 @@ class GraphUtils(BaseModel):
         Returns:
             Ordered list of space names from *source* to *target*, or an
             empty list when no path exists.
+
+        Raises:
+            networkx.NodeNotFound: If *source* or *target* is not in the graph.
         """
-        try:
-            g = self.get_subgraph(edge_type) if edge_type else self.graph
-            return nx.shortest_path(g, source=source, target=target, weight="weight")
-        except nx.NetworkXNoPath:
-            return []
+        if source not in self.graph or target not in self.graph:
+            raise nx.NodeNotFound(
+                f"Either source {source} or target {target} is not in G"
+            )
+        table = self._path_tables.setdefault(edge_type, {})
+        paths = table.get(source)
+        if paths is None:
+            paths = table[source] = _dijkstra_paths(self.graph, source, edge_type)
+        return list(paths.get(target, []))
 
     def get_subgraph(self, edge_type: str) -> nx.MultiDiGraph:
         """Return a view containing all nodes but only edges of *edge_type*.
 
-        Results are cached per *edge_type* value — the cache is intentionally
-        unbounded because the set of edge types is small and fixed.
+        The view is built in constant time and copies nothing; it reflects
+        later changes to the graph and cannot itself be modified. Pass it to
+        :class:`~networkx.MultiDiGraph` for an independent, mutable copy.
 
         Args:
             edge_type: Edge key to retain (e.g. ``'surface_to_surface'``).
 
         Returns:
-            A new :class:`~networkx.MultiDiGraph` containing only the
-            requested edges.
+            A read-only :class:`~networkx.MultiDiGraph` view containing only
+            the requested edges.
         """
-        return _cached_subgraph(self.graph, edge_type)
+        return _edge_type_view(self.graph, edge_type)
 
     # ------------------------------------------------------------------ #
     # Density helpers                                                      #
@@ -101,6 +137,8 @@ class GraphUtils(BaseModel):
     def find_common_density(self, mid_space: str, target_space: str) -> str:
         """Find the highest density shared by *mid_space* atlases and transforms.
 
+        Results are memoised until the cache is next modified.
+
         Args:
             mid_space: Intermediate space name.
             target_space: Final target space name.
@@ -111,6 +149,11 @@ class GraphUtils(BaseModel):
         Raises:
             ValueError: If no common density exists.
         """
+        memo = self._density_results()
+        memo_key = ("common", mid_space, target_space)
+        if (density := memo.get(memo_key)) is not None:
+            return density
+
         atlas_densities = {
             a.density for a in self.cache.get_surface_atlases(space=mid_space)
         }
@@ -125,11 +168,14 @@ class GraphUtils(BaseModel):
             raise ValueError(
                 f"No common density found between '{mid_space}' and '{target_space}'."
             )
-        return max(common, key=_get_density_key)
+        density = memo[memo_key] = max(common, key=self.cache.density_key)
+        return density
 
     def find_highest_density(self, space: str) -> str:
         """Return the highest surface density available for *space*.
 
+        Results are memoised until the cache is next modified.
+
         Args:
             space: Brain template space name.
 
@@ -139,10 +185,16 @@ class GraphUtils(BaseModel):
         Raises:
             ValueError: If no surface atlases are registered for *space*.
         """
+        memo = self._density_results()
+        memo_key = ("highest", space)
+        if (density := memo.get(memo_key)) is not None:
+            return density
+
         densities = {a.density for a in self.cache.get_surface_atlases(space=space)}
         if not densities:
             raise ValueError(f"No surface atlases found for space '{space}'.")
-        return max(densities, key=_get_density_key)
+        density = memo[memo_key] = max(densities, key=self.cache.density_key)
+        return density
 
     # ------------------------------------------------------------------ #
     # Introspection                                                        #
@@ -176,37 +228,90 @@ class GraphUtils(BaseModel):
             Dictionary with counts of nodes, edges, surfaces, volumes, and
             each transform type.
         """
-        nodes_data = [self.get_node_data(n) for n in self.graph.nodes]
-        edge_keys = [k for _, _, k in self.graph.edges(keys=True)]
+        nodes_data = [n for _, n in self.graph.nodes(data="data")]
+        edge_counts = Counter(k for _, _, k in self.graph.edges(keys=True))
         return {
             "num_nodes": self.graph.number_of_nodes(),
             "num_edges": self.graph.number_of_edges(),
             "num_surfaces": sum(len(n.surfaces) for n in nodes_data),
             "num_volumes": sum(len(n.volumes) for n in nodes_data),
-            "num_surface_to_surface_transforms": edge_keys.count("surface_to_surface"),
-            "num_volume_to_volume_transforms": edge_keys.count("volume_to_volume"),
+            "num_surface_to_surface_transforms": edge_counts["surface_to_surface"],
+            "num_volume_to_volume_transforms": edge_counts["volume_to_volume"],
         }
 
 
 # ---------------------------------------------------------------------------
-# Module-level cached subgraph builder
+# Module-level graph algorithms
+# ---------------------------------------------------------------------------
+
+
+def _dijkstra_paths(
+    graph: nx.MultiDiGraph, source: str, edge_type: str | None = None
+) -> dict[str, list[str]]:
+    """Return shortest weighted paths from *source* to every reachable node.
+
+    Equivalent to :func:`networkx.single_source_dijkstra_path` on the
+    *edge_type* subgraph, including its tie-breaking, but walks the successor
+    dicts directly: the subgraph is never materialised and no per-edge weight
+    callable is invoked.
+
+    Args:
+        graph: Graph to traverse.
+        source: Start node; an absent node yields an empty mapping.
+        edge_type: If provided, only traverse edges with this key.
+
+    Returns:
+        Mapping of reachable node to its path from *source* (inclusive).
+    """
+    succ = graph._succ
+    if source not in succ:
+        return {}
+    paths = {source: [source]}
+    dist: dict[str, float] = {}
+    seen = {source: 0.0}
+    tiebreak = count()
+    fringe = [(0.0, next(tiebreak), source)]
+    while fringe:
+        d, _, v = heapq.heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        for u, keydict in succ[v].items():
+            if edge_type is None:
+                cost = min(attrs.get("weight", 1) for attrs in keydict.values())
+            elif edge_type in keydict:
+                cost = keydict[edge_type].get("weight", 1)
+            else:
+                continue
+            vu_dist = d + cost
+            if u not in dist and (u not in seen or vu_dist < seen[u]):
+                seen[u] = vu_dist
+                heapq.heappush(fringe, (vu_dist, next(tiebreak), u))
+                paths[u] = [*paths[v], u]
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Module-level subgraph view
 # ---------------------------------------------------------------------------
 
 
-def _cached_subgraph(graph: nx.MultiDiGraph, edge_type: str) -> nx.MultiDiGraph:
-    """Build and cache a subgraph filtered to *edge_type* edges.
+def _edge_type_view(graph: nx.MultiDiGraph, edge_type: str) -> nx.MultiDiGraph:
+    """Return a read-only view of *graph* restricted to *edge_type* edges.
 
     Args:
         graph: The full graph to filter.
         edge_type: Edge key to retain.
 
     Returns:
-        A new :class:`~networkx.MultiDiGraph` with all nodes and only the
-        matching edges.
+        A frozen :class:`~networkx.MultiDiGraph` view sharing node and edge
+        data with *graph*, with all nodes and only the matching edges.
     """
-    subgraph = nx.MultiDiGraph()
-    subgraph.add_nodes_from(graph.nodes(data=True))
-    for u, v, key, data in graph.edges(data=True, keys=True):
-        if key == edge_type:
-            subgraph.add_edge(u, v, key=key, **data)
-    return subgraph
+
+    def keep(_u: str, _v: str, key: str) -> bool:
+        return key == edge_type
+
+    # subgraph_view instantiates the graph's own class for the view shell, so
+    # view a plain MultiDiGraph rather than constructing a NeuromapsGraph
+    base = nx.graphviews.generic_graph_view(graph, nx.MultiDiGraph)
+    return nx.subgraph_view(base, filter_edge=keep)
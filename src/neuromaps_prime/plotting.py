@@ -1,18 +1,32 @@
 """Functions for plotting neuromaps graphs and subgraphs."""
 
 import logging
-from collections.abc import Callable
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
-from matplotlib import cm
+from matplotlib import cm, colormaps
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
+from scipy.sparse import csgraph, csr_array
 
 _logger = logging.getLogger(__name__)
 
+# Above this many nodes, Kamada-Kawai distances come from SciPy's compiled
+# Dijkstra instead of networkx's pure-Python all-pairs search
+_KK_CSGRAPH_MIN_NODES = 200
+
+# Node positions per graph, keyed by layout settings and graph size
+_LAYOUT_CACHE: WeakKeyDictionary[nx.MultiDiGraph, dict[tuple, dict]] = (
+    WeakKeyDictionary()
+)
+
 
 def plot_graph(
     graph: nx.MultiDiGraph,
@@ -27,6 +41,9 @@ def plot_graph(
     iterations: int = 100,
     seed: int = 42,
     colormap: str = "Set1",
+    fig: Figure | None = None,
+    *,
+    fast_draw: bool = False,
 ) -> None:
     """Plot a neuromaps graph or subgraph.
 
@@ -45,6 +62,16 @@ def plot_graph(
         seed: Random seed for layout algorithms.
         colormap: Colormap to use for node coloring based on species.
             e.g., 'Set1', 'Set2', 'tab10', 'tab20', 'rainbow', 'Dark2', etc.
+        fig: Existing figure to redraw into, e.g. in a dashboard that replots
+            repeatedly. It is cleared and keeps its size; *figsize* is ignored
+            and, unless *save_path* is given, the canvas is redrawn rather than
+            shown.
+        fast_draw: Use matplotlib's constrained layout instead of a
+            ``tight_layout`` pass and save without measuring a tight bounding
+            box, which is cheaper when replotting often. *legend_rect* is
+            ignored; pass e.g. ``legend_loc="outside upper center"`` to keep
+            a figure legend clear of the axes. A figure passed as *fig*
+            keeps its own layout engine.
 
     """
     if graph_type not in ["surface", "volume", "combined"]:
@@ -64,6 +91,8 @@ def plot_graph(
         "iterations": iterations,
         "seed": seed,
         "colormap": colormap,
+        "fig": fig,
+        "fast_draw": fast_draw,
     }
 
     if graph_type == "combined":
@@ -87,11 +116,34 @@ def _get_optimized_layout(
     k: float = 3.0,
     iterations: int = 100,
     seed: int = 42,
+    species_groups: dict[str, list[str]] | None = None,
 ) -> dict:
-    """Get optimized node positions to minimize edge crossings."""
+    """Get optimized node positions to minimize edge crossings.
+
+    Positions are cached per graph and layout settings, so repeated plots of
+    an unchanged graph skip the layout computation.
+    """
+    key = (layout, k, iterations, seed, graph.number_of_nodes(), graph.size())
+    graph_layouts = _LAYOUT_CACHE.setdefault(graph, {})
+    if (pos := graph_layouts.get(key)) is None:
+        if species_groups is None:
+            species_groups = _get_species_groups(graph)
+        pos = graph_layouts[key] = _compute_layout(
+            graph, layout, k, iterations, seed, species_groups
+        )
+    return dict(pos)
+
+
+def _compute_layout(
+    graph: nx.MultiDiGraph,
+    layout: str,
+    k: float,
+    iterations: int,
+    seed: int,
+    species_groups: dict[str, list[str]],
+) -> dict:
+    """Compute node positions with the requested layout algorithm."""
     if layout == "hierarchical":
-        # Group nodes by species for hierarchical layout
-        species_groups = _get_species_groups(graph)
         try:
             return nx.nx_agraph.graphviz_layout(graph, prog="dot")
         except (ImportError, FileNotFoundError):
@@ -100,16 +152,17 @@ def _get_optimized_layout(
 
     elif layout == "circular":
         # Circular layout with species grouping
-        return _species_circular_layout(graph)
+        return _species_circular_layout(species_groups)
 
     elif layout == "shell":
         # Shell layout with species as shells
-        species_groups = _get_species_groups(graph)
         shells = list(species_groups.values())
         return nx.shell_layout(graph, nlist=shells)
 
     elif layout == "kamada_kawai":
         # Kamada-Kawai layout (good for small graphs)
+        if graph.number_of_nodes() > _KK_CSGRAPH_MIN_NODES:
+            return nx.kamada_kawai_layout(graph, dist=_shortest_path_lengths(graph))
         return nx.kamada_kawai_layout(graph)
 
     elif layout == "planar":
@@ -123,72 +176,90 @@ def _get_optimized_layout(
     return nx.spring_layout(graph, k=k, iterations=iterations, seed=seed)
 
 
+def _shortest_path_lengths(graph: nx.MultiDiGraph) -> dict[str, dict[str, float]]:
+    """All-pairs weighted shortest path lengths, computed by SciPy.
+
+    Matches ``dict(nx.shortest_path_length(graph, weight="weight"))``, with
+    parallel edges contributing their lightest weight and unreachable pairs
+    omitted, but runs Dijkstra in compiled code.
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    weights: dict[tuple[int, int], float] = {}
+    for u, v, w in graph.edges(data="weight", default=1):
+        ij = (index[u], index[v])
+        weights[ij] = min(w, weights.get(ij, w))
+
+    n = len(nodes)
+    rows, cols = zip(*weights, strict=True) if weights else ((), ())
+    adjacency = csr_array(
+        (list(weights.values()), (rows, cols)), shape=(n, n), dtype=float
+    )
+    lengths = csgraph.shortest_path(adjacency, method="D", directed=True)
+    return {
+        node: {nodes[j]: float(d) for j, d in enumerate(row) if np.isfinite(d)}
+        for node, row in zip(nodes, lengths, strict=True)
+    }
+
+
 def _hierarchical_multipartite_layout(
     species_groups: dict[str, list[str]],
 ) -> dict[str, tuple[int, int]]:
     """Create a hierarchical layout based on species groups."""
-    pos = {}
-    y_offset = 0
     species_list = sorted(species_groups.keys())
+    if not species_list:
+        return {}
+    nodes = [node for species in species_list for node in species_groups[species]]
+    counts = [len(species_groups[species]) for species in species_list]
 
-    for species in species_list:
-        nodes = species_groups[species]
-        n_nodes = len(nodes)
-
-        # Arrange nodes in a horizontal line for each species
-        if n_nodes == 1:
-            x_positions = [0]
-        else:
-            x_positions = np.linspace(
-                -n_nodes / 2, n_nodes / 2, n_nodes, dtype=int
-            ).tolist()
-
-        for j, node in enumerate(nodes):
-            pos[node] = (x_positions[j], y_offset)
-
-        y_offset += 2  # Space between species levels
-
-    return pos
+    # Arrange nodes in a horizontal line for each species
+    xs = np.concatenate(
+        [
+            np.linspace(-n / 2, n / 2, n, dtype=int) if n > 1 else np.zeros(n, int)
+            for n in counts
+        ]
+    )
+    # Space between species levels
+    ys = np.repeat(np.arange(len(species_list)) * 2, counts)
+    return dict(zip(nodes, zip(xs.tolist(), ys.tolist(), strict=True), strict=True))
 
 
-def _species_circular_layout(graph: nx.MultiDiGraph) -> dict:
+def _species_circular_layout(species_groups: dict[str, list[str]]) -> dict:
     """Create a circular layout with species grouped together."""
-    # Group nodes by species
-    species_groups: dict[str, list[str]] = {}
-    for node, data in graph.nodes(data=True):
-        species = data["data"].species
-        species_groups.setdefault(species, []).append(node)
-
-    pos = {}
     species_list = sorted(species_groups.keys())
     n_species = len(species_list)
-
-    # Calculate angular positions for each species group
+    if not n_species:
+        return {}
+    sector_width = 2 * np.pi / n_species * 0.8  # 80% of available space
+
+    # Collect every node's angle and index within its species, then place all
+    # nodes in one vectorised pass
+    nodes: list[str] = []
+    angles: list[np.ndarray] = []
+    within: list[np.ndarray] = []
     for i, species in enumerate(species_list):
-        nodes = species_groups[species]
-        n_nodes = len(nodes)
-
-        # Base angle for this species group
+        group = species_groups[species]
+        n_nodes = len(group)
         base_angle = 2 * np.pi * i / n_species
-
         # Spread nodes within a sector
         if n_nodes == 1:
-            angles = [base_angle]
+            angles.append(np.array([base_angle]))
         else:
-            sector_width = 2 * np.pi / n_species * 0.8  # 80% of available space
-            angles = np.linspace(
-                base_angle - sector_width / 2, base_angle + sector_width / 2, n_nodes
-            ).tolist()
-
-        # Different radii for variety
-        radii = [1.0 + 0.3 * (j % 2) for j in range(n_nodes)]
-
-        for j, node in enumerate(nodes):
-            angle = angles[j]
-            radius = radii[j]
-            pos[node] = (radius * np.cos(angle), radius * np.sin(angle))
+            angles.append(
+                np.linspace(
+                    base_angle - sector_width / 2,
+                    base_angle + sector_width / 2,
+                    n_nodes,
+                )
+            )
+        within.append(np.arange(n_nodes))
+        nodes.extend(group)
 
-    return pos
+    theta = np.concatenate(angles)
+    # Different radii for variety
+    radii = 1.0 + 0.3 * (np.concatenate(within) % 2)
+    xy = np.column_stack((radii * np.cos(theta), radii * np.sin(theta)))
+    return dict(zip(nodes, map(tuple, xy.tolist()), strict=True))
 
 
 def _plot_combined_graph(
@@ -203,27 +274,36 @@ def _plot_combined_graph(
     iterations: int,
     seed: int,
     colormap: str,
+    fig: Figure | None,
+    *,
+    fast_draw: bool,
 ) -> None:
     """Plot combined surface and volume transforms in separate subplots."""
-    fig, axes = plt.subplots(1, 2, figsize=figsize)
+    reuse = fig is not None
+    fig, axes = _prepare_figure(fig, figsize, ncols=2, fast_draw=fast_draw)
+
+    # Group nodes by species once for the layout and node colours
+    species_groups = _get_species_groups(graph)
 
     # Use optimized layout
-    pos = _get_optimized_layout(graph, layout, k, iterations, seed)
+    pos = _get_optimized_layout(graph, layout, k, iterations, seed, species_groups)
+    node_xy = np.array([pos[node] for node in graph]).reshape(-1, 2)
 
     # Get node colors by species
-    node_colors, species_colors_map = _get_node_colors(graph, colormap)
+    node_colors, species_colors_map = _get_node_colors(graph, colormap, species_groups)
 
     # Separate edges by type
     surface_edges, volume_edges = _separate_edges(graph)
 
     # Get color maps for edges
-    surface_colors = _get_edge_colors(surface_edges, cm.Set1)
-    volume_colors = _get_edge_colors(volume_edges, cm.Set2)
+    surface_colors = _get_edge_colors(surface_edges, "Set1")
+    volume_colors = _get_edge_colors(volume_edges, "Set2")
 
     # Plot surface transforms
     _draw_subplot(
         graph,
         pos,
+        node_xy,
         axes[0],
         node_colors,
         surface_edges,
@@ -238,6 +318,7 @@ def _plot_combined_graph(
     _draw_subplot(
         graph,
         pos,
+        node_xy,
         axes[1],
         node_colors,
         volume_edges,
@@ -253,9 +334,10 @@ def _plot_combined_graph(
         species_colors_map, surface_colors, volume_colors
     )
     fig.legend(handles=legend_elements, fontsize=font_size, loc=legend_loc, ncol=5)
-    plt.tight_layout(rect=legend_rect)
+    if not fast_draw:
+        fig.tight_layout(rect=legend_rect)
 
-    _save_or_show(save_path)
+    _save_or_show(fig, save_path, reuse=reuse, fast_draw=fast_draw)
 
 
 def _plot_single_graph(
@@ -271,25 +353,34 @@ def _plot_single_graph(
     k: float,
     iterations: int,
     seed: int,
+    fig: Figure | None,
+    *,
+    fast_draw: bool,
 ) -> None:
     """Plot either surface or volume transforms in a single plot."""
-    _, ax = plt.subplots(1, 1, figsize=figsize)
+    reuse = fig is not None
+    fig, ax = _prepare_figure(fig, figsize, ncols=1, fast_draw=fast_draw)
+
+    # Group nodes by species once for the layout and node colours
+    species_groups = _get_species_groups(graph)
 
     # Use optimized layout
-    pos = _get_optimized_layout(graph, layout, k, iterations, seed)
+    pos = _get_optimized_layout(graph, layout, k, iterations, seed, species_groups)
+    node_xy = np.array([pos[node] for node in graph]).reshape(-1, 2)
 
     # Get node colors by species
-    node_colors, species_colors_map = _get_node_colors(graph, colormap)
+    node_colors, species_colors_map = _get_node_colors(graph, colormap, species_groups)
 
+    surface_edges, volume_edges = _separate_edges(graph)
     if graph_type == "surface":
-        edges = _extract_surface_edges(graph)
-        edge_colors = _get_edge_colors(edges, cm.Set1)
+        edges = surface_edges
+        edge_colors = _get_edge_colors(edges, "Set1")
         title = "Surface Transforms"
         linestyle, arrowstyle = "-", "->"
         legend_prefix = "Surface"
     else:  # volume
-        edges = _extract_volume_edges(graph)
-        edge_colors = _get_edge_colors(edges, cm.Set2)
+        edges = volume_edges
+        edge_colors = _get_edge_colors(edges, "Set2")
         title = "Volume Transforms"
         linestyle, arrowstyle = "--", "-|>"
         legend_prefix = "Volume"
@@ -298,6 +389,7 @@ def _plot_single_graph(
     _draw_subplot(
         graph,
         pos,
+        node_xy,
         ax,
         node_colors,
         edges,
@@ -309,111 +401,80 @@ def _plot_single_graph(
     )
 
     # Create legend
-    legend_elements = [
-        Line2D(
-            [0],
-            [0],
-            marker="o",
-            color="w",
-            markerfacecolor=color,
-            markersize=12,
-            label=f"Species: {s}",
-        )
-        for s, color in species_colors_map.items()
-    ] + [
-        Line2D(
-            [0],
-            [0],
-            color=color,
-            lw=3,
-            linestyle=linestyle,
-            label=f"{legend_prefix} {attr}",
+    legend_elements = list(
+        chain(
+            _species_handles(species_colors_map),
+            _edge_handles(legend_prefix, edge_colors, linestyle),
         )
-        for attr, color in edge_colors.items()
-    ]
+    )
 
     ax.legend(handles=legend_elements, fontsize=font_size, loc=legend_loc)
-    plt.tight_layout(rect=legend_rect)
+    if not fast_draw:
+        fig.tight_layout(rect=legend_rect)
 
-    _save_or_show(save_path)
+    _save_or_show(fig, save_path, reuse=reuse, fast_draw=fast_draw)
 
 
-def _get_node_colors(graph: nx.MultiDiGraph, colormap: str) -> tuple[list, dict]:
+def _get_node_colors(
+    graph: nx.MultiDiGraph, colormap: str, species_groups: dict[str, list[str]]
+) -> tuple[list, dict]:
     """Get node colors based on species from Node dataclass."""
-    # Extract unique species from Node objects
-    species_set = {node_data["data"].species for _, node_data in graph.nodes(data=True)}
-    species_list = sorted(species_set)
+    species_list = sorted(species_groups)
 
-    # Create color mapping for each species
+    # Create color mapping for each species from one colormap evaluation
     cmap = getattr(cm, colormap)
-    species_colors_map = {
-        species: cmap(i / max(1, len(species_list) - 1))
-        for i, species in enumerate(species_list)
-    }
+    colors = cmap(np.arange(len(species_list)) / max(1, len(species_list) - 1))
+    species_colors_map = dict(
+        zip(species_list, map(tuple, colors.tolist()), strict=True)
+    )
 
-    # Assign colors to each node based on species
-    node_colors = [
-        species_colors_map[node_data["data"].species]
-        for _, node_data in graph.nodes(data=True)
-    ]
+    # Assign colors to each node based on species, in graph node order
+    node_color = {
+        node: species_colors_map[species]
+        for species, nodes in species_groups.items()
+        for node in nodes
+    }
+    node_colors = [node_color[node] for node in graph]
 
     return node_colors, species_colors_map
 
 
 def _separate_edges(graph: nx.MultiDiGraph) -> tuple[dict, dict]:
-    """Separate surface and volume edges."""
+    """Separate surface and volume edges in a single pass over the graph."""
     surface_edges: dict = {}
     volume_edges: dict = {}
+    add_surface = surface_edges.setdefault
+    add_volume = volume_edges.setdefault
 
-    for u, v, data in graph.edges(data=True):
-        edge_data = data.get("data")
+    for u, v, edge_data in graph.edges(data="data"):
         if not edge_data:
             continue
-        for st in getattr(edge_data, "surface_transforms", []):
-            key = (u, v, st.density)
-            surface_edges.setdefault(key, []).append(st)
-        for vt in getattr(edge_data, "volume_transforms", []):
-            key = (u, v, vt.resolution)
-            volume_edges.setdefault(key, []).append(vt)
+        for st in getattr(edge_data, "surface_transforms", ()):
+            add_surface((u, v, st.density), []).append(st)
+        for vt in getattr(edge_data, "volume_transforms", ()):
+            add_volume((u, v, vt.resolution), []).append(vt)
 
     return surface_edges, volume_edges
 
 
-def _extract_surface_edges(graph: nx.MultiDiGraph) -> dict:
-    """Extract only surface edges from graph."""
-    surface_edges: dict = {}
-    for u, v, data in graph.edges(data=True):
-        edge_data = data.get("data")
-        if not edge_data:
-            continue
-        for st in getattr(edge_data, "surface_transforms", []):
-            key = (u, v, st.density)
-            surface_edges.setdefault(key, []).append(st)
-    return surface_edges
+def _get_edge_colors(edges: dict, colormap: str) -> dict:
+    """Get color mapping for edge attributes, assigned in sorted order."""
+    return dict(_edge_colors(frozenset(attr for _, _, attr in edges), colormap))
 
 
-def _extract_volume_edges(graph: nx.MultiDiGraph) -> dict:
-    """Extract only volume edges from graph."""
-    volume_edges: dict = {}
-    for u, v, data in graph.edges(data=True):
-        edge_data = data.get("data")
-        if not edge_data:
-            continue
-        for vt in getattr(edge_data, "volume_transforms", []):
-            key = (u, v, vt.resolution)
-            volume_edges.setdefault(key, []).append(vt)
-    return volume_edges
-
-
-def _get_edge_colors(edges: dict, colormap: Callable[[float], Any]) -> dict:
-    """Get color mapping for edge attributes."""
-    attrs = {attr for (_, _, attr) in edges}
-    return {attr: colormap(i / max(1, len(attrs))) for i, attr in enumerate(attrs)}
+@lru_cache(maxsize=32)
+def _edge_colors(attrs: frozenset[str], colormap: str) -> tuple[tuple[str, Any], ...]:
+    """Cache colours for an edge attribute set drawn from a named colormap."""
+    cmap = colormaps[colormap]
+    return tuple(
+        (attr, cmap(i / max(1, len(attrs)))) for i, attr in enumerate(sorted(attrs))
+    )
 
 
 def _draw_subplot(
     graph: nx.MultiDiGraph,
     pos: dict,
+    node_xy: np.ndarray,
     ax: plt.Axes,
     node_colors: list,
     edges: dict,
@@ -423,17 +484,21 @@ def _draw_subplot(
     arrowstyle: str,
     font_size: int,
 ) -> None:
-    """Draw nodes, edges, and labels on a subplot."""
-    # Draw nodes
-    nx.draw_networkx_nodes(
-        graph,
-        pos,
-        node_color=node_colors,
-        node_size=5500,
+    """Draw nodes, edges, and labels on a subplot.
+
+    Nodes are scattered straight from *node_xy*, the positions of the nodes in
+    graph order, which the caller builds once for every subplot.
+    """
+    # Draw nodes above the edges, as networkx does
+    ax.scatter(
+        node_xy[:, 0],
+        node_xy[:, 1],
+        s=5500,
+        c=node_colors,
         alpha=0.8,
         edgecolors="black",
         linewidths=1.5,
-        ax=ax,
+        zorder=2,
     )
     nx.draw_networkx_labels(graph, pos, font_size=font_size, font_weight="bold", ax=ax)
 
@@ -460,66 +525,102 @@ def _draw_edges(
     linestyle: str,
     arrowstyle: str,
 ) -> None:
-    """Draw edges with proper curves for multiple connections."""
-    edge_groups: dict[tuple[str, str], list[tuple[str, list]]] = {}
-    for (u, v, attr), edges_list in edges.items():
-        edge_groups.setdefault((u, v), []).append((attr, edges_list))
-
-    for (u, v), group in edge_groups.items():
-        n = len(group)
-        base_rad = 0.1 if linestyle == "-" else -0.1
-        for i, (attr, _) in enumerate(group):
+    """Draw edges with proper curves for multiple connections.
+
+    Edges sharing a colour and curvature are drawn in one call, so networkx
+    validates and lays out each style once rather than once per edge.
+    """
+    edge_groups: dict[tuple[str, str], list[str]] = {}
+    for u, v, attr in edges:
+        edge_groups.setdefault((u, v), []).append(attr)
+
+    base_rad = 0.1 if linestyle == "-" else -0.1
+    batches: dict[tuple[str, float], list[tuple[str, str]]] = {}
+    for (u, v), attrs in edge_groups.items():
+        n = len(attrs)
+        for i, attr in enumerate(attrs):
             rad = base_rad + (i - (n - 1) / 2) * 0.15 if n > 1 else base_rad
-            nx.draw_networkx_edges(
-                graph,
-                pos,
-                edgelist=[(u, v)],
-                ax=ax,
-                edge_color=edge_colors[attr],
-                style=linestyle,
-                arrows=True,
-                arrowsize=15,
-                arrowstyle=arrowstyle,
-                alpha=0.7,
-                connectionstyle=f"arc3,rad={rad}",
-                width=2,
-                min_source_margin=40,
-                min_target_margin=40,
-            )
+            batches.setdefault((attr, rad), []).append((u, v))
+
+    for (attr, rad), edgelist in batches.items():
+        nx.draw_networkx_edges(
+            graph,
+            pos,
+            edgelist=edgelist,
+            ax=ax,
+            edge_color=edge_colors[attr],
+            style=linestyle,
+            arrows=True,
+            arrowsize=15,
+            arrowstyle=arrowstyle,
+            alpha=0.7,
+            connectionstyle=f"arc3,rad={rad}",
+            width=2,
+            min_source_margin=40,
+            min_target_margin=40,
+        )
 
 
 def _create_legend_elements(
     species_colors_map: dict, surface_colors: dict, volume_colors: dict
 ) -> list:
     """Create legend elements for combined plot."""
-    return (
-        [
-            Line2D(
-                [0],
-                [0],
-                marker="o",
-                color="w",
-                markerfacecolor=color,
-                markersize=12,
-                label=f"Species: {s}",
-            )
-            for s, color in species_colors_map.items()
-        ]
-        + [
-            Line2D([0], [0], color=color, lw=3, label=f"Surface {dens}")
-            for dens, color in surface_colors.items()
-        ]
-        + [
-            Line2D([0], [0], color=color, lw=3, linestyle="--", label=f"Volume {res}")
-            for res, color in volume_colors.items()
-        ]
+    return list(
+        chain(
+            _species_handles(species_colors_map),
+            _edge_handles("Surface", surface_colors, "-"),
+            _edge_handles("Volume", volume_colors, "--"),
+        )
     )
 
 
-def _save_or_show(save_path: Path | None) -> None:
-    """Save plot to file or show it."""
+def _species_handles(species_colors_map: dict) -> Iterator[Line2D]:
+    """Yield a legend marker for each species."""
+    for s, color in species_colors_map.items():
+        yield Line2D(
+            [0],
+            [0],
+            marker="o",
+            color="w",
+            markerfacecolor=color,
+            markersize=12,
+            label=f"Species: {s}",
+        )
+
+
+def _edge_handles(prefix: str, edge_colors: dict, linestyle: str) -> Iterator[Line2D]:
+    """Yield a legend line for each edge attribute."""
+    for attr, color in edge_colors.items():
+        yield Line2D(
+            [0], [0], color=color, lw=3, linestyle=linestyle, label=f"{prefix} {attr}"
+        )
+
+
+def _prepare_figure(
+    fig: Figure | None, figsize: tuple[int, int], ncols: int, *, fast_draw: bool
+) -> tuple[Figure, Any]:
+    """Return a figure and its axes, clearing and reusing *fig* when given.
+
+    Only figures created here get the constrained layout engine; a caller's
+    figure keeps whatever engine it was configured with.
+    """
+    layout = "constrained" if fast_draw else None
+    if fig is None:
+        return plt.subplots(1, ncols, figsize=figsize, layout=layout)
+    fig.clear()
+    return fig, fig.subplots(1, ncols)
+
+
+def _save_or_show(
+    fig: Figure, save_path: Path | None, *, reuse: bool, fast_draw: bool
+) -> None:
+    """Save plot to file, redraw a reused figure, or show a new one."""
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches="tight", facecolor="white")
+        # A tight bounding box needs an extra render just to measure extent
+        bbox_inches = None if fast_draw else "tight"
+        fig.savefig(save_path, dpi=300, bbox_inches=bbox_inches, facecolor="white")
         _logger.info(f"Graph saved to: {save_path}")
+    elif reuse:
+        fig.canvas.draw_idle()
     else:
         plt.show()
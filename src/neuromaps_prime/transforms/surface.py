@@ -1,18 +1,89 @@
 """Functions for surface transformations using niwrap."""
 
+import os
+import shutil
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
+import niwrap
 from niwrap import workbench
 
+if TYPE_CHECKING:
+    from styxdefs import Metadata
+
 _RESAMPLE_METHODS = frozenset({"ADAP_BARY_AREA", "BARYCENTRIC"})
 
 
+def _require_files(files: dict[str, str | Path]) -> list[Path]:
+    """Return *files* as paths, checking they all exist.
+
+    Args:
+        files: Input file paths keyed by a description used in errors.
+
+    Returns:
+        The paths, in the order given.
+
+    Raises:
+        FileNotFoundError: Naming every missing input at once.
+    """
+    paths = [Path(path) for path in files.values()]
+    missing = [
+        f"{desc} not found: {path}"
+        for desc, path in zip(files, paths, strict=True)
+        if not path.exists()
+    ]
+    if missing:
+        raise FileNotFoundError("; ".join(missing))
+    return paths
+
+
+def _same_files(*paths: str | Path) -> bool:
+    """Return whether every path refers to the same file on disk."""
+    first, *rest = map(Path, paths)
+    return all(first.samefile(path) for path in rest)
+
+
+def copy_unchanged(
+    input_file: str | Path, output_file: str | Path, metadata: "Metadata"
+) -> Path:
+    """Copy *input_file* to the output of a transform that leaves it unchanged.
+
+    The output path is resolved by the global runner, as it would be for the
+    Workbench call being skipped, so relative paths land in the same place.
+
+    Args:
+        input_file: File the skipped transform would have read.
+        output_file: Output path as passed to the Workbench wrapper.
+        metadata: Metadata of the Workbench command being skipped.
+
+    Returns:
+        Path of the copied output file.
+    """
+    execution = niwrap.get_global_runner().start_execution(metadata)
+    output = Path(execution.output_file(os.fspath(output_file)))
+    if not (output.exists() and output.samefile(input_file)):
+        shutil.copyfile(input_file, output)
+    return output
+
+
+def _is_identity_resample(
+    current_sphere: Path, new_sphere: Path, area_surfs: dict | None
+) -> bool:
+    """Return whether resampling between the given spheres changes nothing."""
+    if not _same_files(current_sphere, new_sphere):
+        return False
+    return not area_surfs or _same_files(
+        area_surfs["current-area"], area_surfs["new-area"]
+    )
+
+
 def surface_sphere_project_unproject(
     sphere_in: str | Path,
     sphere_project_to: str | Path,
     sphere_unproject_from: str | Path,
     sphere_out: str | Path,
+    *,
+    skip_trivial: bool = True,
 ) -> workbench.SurfaceSphereProjectUnprojectOutputs:
     """Project and unproject a surface from one sphere to another.
 
@@ -21,6 +92,9 @@ def surface_sphere_project_unproject(
         sphere_project_to: File path of spherical surface to project to.
         sphere_unproject_from: File path of spherical surface to unproject from.
         sphere_out: Path to output spherical surface.
+        skip_trivial: Copy *sphere_in* to *sphere_out* instead of running
+            Workbench when all three input spheres are the same file, which
+            makes the projection an identity.
 
     Returns:
         Object containing the path to the output spherical surface as result.sphere_out.
@@ -28,17 +102,23 @@ def surface_sphere_project_unproject(
     Raises:
         FileNotFoundError: If any input file does not exist.
     """
-    sphere_in, sphere_project_to, sphere_unproject_from = map(
-        Path, [sphere_in, sphere_project_to, sphere_unproject_from]
+    sphere_in, sphere_project_to, sphere_unproject_from = _require_files(
+        {
+            "Input sphere": sphere_in,
+            "Sphere to project to": sphere_project_to,
+            "Sphere to unproject from": sphere_unproject_from,
+        }
     )
-    # Validate input files
-    for path, desc in zip(
-        [sphere_in, sphere_project_to, sphere_unproject_from],
-        ["Input sphere", "Sphere to project to", "Sphere to unproject from"],
-        strict=True,
+
+    if skip_trivial and _same_files(
+        sphere_in, sphere_project_to, sphere_unproject_from
     ):
-        if not path.exists():
-            raise FileNotFoundError(f"{desc} not found: {path}")
+        sphere_out = copy_unchanged(
+            sphere_in, sphere_out, workbench.SURFACE_SPHERE_PROJECT_UNPROJECT_METADATA
+        )
+        return workbench.SurfaceSphereProjectUnprojectOutputs(
+            root=sphere_out.parent, sphere_out=sphere_out
+        )
 
     result = workbench.surface_sphere_project_unproject(
         sphere_in=sphere_in,
@@ -58,6 +138,8 @@ def metric_resample(
     method: Literal["ADAP_BARY_AREA", "BARYCENTRIC"],
     area_surfs: workbench.MetricResampleAreaSurfsParamsDict,  # type: ignore[valid-type]
     output_file_path: str,
+    *,
+    skip_trivial: bool = True,
 ) -> workbench.MetricResampleOutputs:
     """Resample a surface metric from one sphere to another.
 
@@ -68,6 +150,9 @@ def metric_resample(
         method: Resampling method.
         area_surfs: Area surfaces to perform vertex area correction on.
         output_file_path: Path to output metric file.
+        skip_trivial: Copy the input to *output_file_path* instead of running
+            Workbench when both spheres, and both area surfaces, are the same
+            file, which makes the resampling an identity.
 
     Returns:
         Object containing the path to the output metric as result.metric_out.
@@ -76,23 +161,27 @@ def metric_resample(
         FileNotFoundError: If any input file does not exist or output file not created.
         NotImplementedError: If selected resampling method is not available.
     """
-    input_file_path, current_sphere, new_sphere = map(
-        Path, [input_file_path, current_sphere, new_sphere]
+    input_file_path, current_sphere, new_sphere = _require_files(
+        {
+            "Input file": input_file_path,
+            "Current sphere": current_sphere,
+            "New sphere": new_sphere,
+        }
     )
-    # Validate input files
-    for path, desc in zip(
-        [input_file_path, current_sphere, new_sphere],
-        ["Input file", "Current sphere", "New sphere"],
-        strict=True,
-    ):
-        if not path.exists():
-            raise FileNotFoundError(f"{desc} not found: {path}")
 
     if method not in _RESAMPLE_METHODS:
         raise NotImplementedError(
             f"Resampling method '{method}' is not implemented in this function."
         )
 
+    if skip_trivial and _is_identity_resample(current_sphere, new_sphere, area_surfs):
+        output_file = copy_unchanged(
+            input_file_path, output_file_path, workbench.METRIC_RESAMPLE_METADATA
+        )
+        return workbench.MetricResampleOutputs(
+            root=output_file.parent, metric_out=output_file, valid_roi_out=None
+        )
+
     result = workbench.metric_resample(
         metric_in=input_file_path,
         current_sphere=current_sphere,
@@ -113,6 +202,8 @@ def label_resample(
     method: Literal["ADAP_BARY_AREA", "BARYCENTRIC"],
     area_surfs: workbench.LabelResampleAreaSurfsParamsDict,  # type: ignore[valid-type]
     output_file_path: str,
+    *,
+    skip_trivial: bool = True,
 ) -> workbench.LabelResampleOutputs:
     """Resample a surface label from one sphere to another.
 
@@ -123,6 +214,9 @@ def label_resample(
         method: Resampling method.
         area_surfs: Area surfaces to perform vertex area correction on.
         output_file_path: Path to output label file.
+        skip_trivial: Copy the input to *output_file_path* instead of running
+            Workbench when both spheres, and both area surfaces, are the same
+            file, which makes the resampling an identity.
 
     Returns:
         Object containing the path to the output label as result.label_out.
@@ -131,23 +225,27 @@ def label_resample(
         FileNotFoundError: If any input file does not exist or output file not created.
         NotImplementedError: If selected resampling method is not available.
     """
-    input_file_path, current_sphere, new_sphere = map(
-        Path, [input_file_path, current_sphere, new_sphere]
+    input_file_path, current_sphere, new_sphere = _require_files(
+        {
+            "Input file": input_file_path,
+            "Current sphere": current_sphere,
+            "New sphere": new_sphere,
+        }
     )
-    # Validate input files
-    for path, desc in zip(
-        [input_file_path, current_sphere, new_sphere],
-        ["Input file", "Current sphere", "New sphere"],
-        strict=True,
-    ):
-        if not path.exists():
-            raise FileNotFoundError(f"{desc} not found: {path}")
 
     if method not in _RESAMPLE_METHODS:
         raise NotImplementedError(
             f"Resampling method '{method}' is not implemented in this function."
         )
 
+    if skip_trivial and _is_identity_resample(current_sphere, new_sphere, area_surfs):
+        output_file = copy_unchanged(
+            input_file_path, output_file_path, workbench.LABEL_RESAMPLE_METADATA
+        )
+        return workbench.LabelResampleOutputs(
+            root=output_file.parent, label_out=output_file, valid_roi_out=None
+        )
+
     result = workbench.label_resample(
         label_in=input_file_path,
         current_sphere=current_sphere,
@@ -19,16 +19,35 @@ def estimate_surface_density(surface_file: Path) -> str:
     return f"{round(count / 1000)}k"
 
 
-@lru_cache
 def get_vertex_count(surface_file: Path) -> int:
     """Get number of vertices in a GIFTI surface file.
 
+    Counts are cached on the file's resolved path, modification time and size,
+    so a file rewritten in place is read again.
+
     Args:
         surface_file: Path to the input GIFTI surface file.
 
     Returns:
         Number of vertices in the surface file.
     """
+    surface_file = Path(surface_file)
+    try:
+        stat = surface_file.stat()
+    except OSError:
+        # Nothing to key a cache entry on; let the loader report the problem
+        return _read_vertex_count(surface_file)
+    return _cached_vertex_count(surface_file.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _cached_vertex_count(surface_file: Path, mtime_ns: int, size: int) -> int:  # noqa: ARG001
+    """Cache :func:`_read_vertex_count` per file version."""
+    return _read_vertex_count(surface_file)
+
+
+def _read_vertex_count(surface_file: Path) -> int:
+    """Load *surface_file* and return its vertex count."""
     surface = nib.load(surface_file)
     if not isinstance(surface, nib.GiftiImage):
         raise TypeError(f"Input file is not a GIFTI surface file: {surface_file}.")
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import sys
+import threading
+from dataclasses import fields
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
@@ -32,6 +36,16 @@ class TestGraphCacheRequireSurface:
         )
         assert result is a
 
+    def test_surface_atlas_hemisphere_case_insensitive(
+        self, graph: NeuromapsGraph
+    ) -> None:
+        """Test single-atlas lookups match the hemisphere in any case."""
+        a = graph._cache.get_surface_atlases(space="Yerkes19", hemisphere="left")[0]
+        for hemi in ("Left", "LEFT"):
+            lookup = (a.space, a.density, hemi, a.resource_type)
+            assert graph._cache.get_surface_atlas(*lookup) is a
+            assert graph._cache.require_surface_atlas(*lookup) is a
+
     def test_require_surface_atlas_miss(self, graph: NeuromapsGraph) -> None:
         """Test require_surface_atlas raises ValueError when not found."""
         with pytest.raises(ValueError, match="No 'sphere' surface atlas found"):
@@ -42,6 +56,43 @@ class TestGraphCacheRequireSurface:
                 resource_type="sphere",
             )
 
+    def test_require_surface_atlases(self, graph: NeuromapsGraph) -> None:
+        """Test require_surface_atlases returns one atlas per resource type."""
+        a = graph._cache.get_surface_atlases(space="Yerkes19")[0]
+        types = {
+            b.resource_type
+            for b in graph._cache.get_surface_atlases(
+                space=a.space, density=a.density, hemisphere=a.hemisphere
+            )
+        }
+        result = graph._cache.require_surface_atlases(
+            space=a.space,
+            density=a.density,
+            hemisphere=a.hemisphere,
+            resource_types=types,
+        )
+        assert set(result) == types
+        assert (
+            graph._cache.require_surface_atlases(
+                space=a.space,
+                density=a.density,
+                hemisphere=a.hemisphere.upper(),
+                resource_types=types,
+            )
+            == result
+        )
+        for resource_type, atlas in result.items():
+            assert atlas is graph._cache.get_surface_atlas(
+                a.space, a.density, a.hemisphere, resource_type
+            )
+        with pytest.raises(ValueError, match="No 'alien' surface atlas found"):
+            graph._cache.require_surface_atlases(
+                space=a.space,
+                density=a.density,
+                hemisphere=a.hemisphere,
+                resource_types=[*types, "alien"],
+            )
+
     def test_require_volume_atlas_hit(self, graph: NeuromapsGraph) -> None:
         """Test require_volume_atlas returns the atlas when found."""
         atlases = graph._cache.get_volume_atlases(space="D99")
@@ -59,6 +110,32 @@ class TestGraphCacheRequireSurface:
                 space="nonexistent", resolution="250um", resource_type="T1w"
             )
 
+    def test_get_surface_atlases_by_space(self, tmp_path: Path) -> None:
+        """Test surface atlas searches stay scoped to the requested space."""
+        f = tmp_path / "sphere.surf.gii"
+        f.touch()
+        cache = GraphCache()
+        atlases = [
+            models.SurfaceAtlas(
+                name=f"{space}_{hemi}",
+                description="Sphere atlas",
+                file_path=f,
+                space=space,
+                density="32k",
+                hemisphere=hemi,
+                resource_type="sphere",
+            )
+            for space in ("Yerkes19", "S1200")
+            for hemi in ("left", "right")
+        ]
+        cache.add_surface_atlases(atlases[:2])
+        for atlas in atlases[2:]:
+            cache.add_surface_atlas(atlas)
+        assert cache.get_surface_atlases("Yerkes19") == atlases[:2]
+        assert cache.get_surface_atlases("S1200", hemisphere="right") == [atlases[3]]
+        cache.clear()
+        assert cache.get_surface_atlases("Yerkes19") == []
+
 
 # ---------------------------------------------------------------------------
 # Helpers shared by TestGraphCacheSurface
@@ -228,6 +305,29 @@ class TestGraphCacheSurface:
         result = cache.get_surface_transform("A", "B", "32k", "right", "sphere")
         assert result is t
 
+    def test_no_provider_tracks_overwrite_of_first(self, f: Path, alt_f: Path) -> None:
+        """Overwriting the first provider updates the provider-agnostic lookup."""
+        cache = GraphCache()
+        cache.add_surface_transform(
+            _make_surface_transform(
+                f, "A", "B", "32k", "left", "sphere", provider="ProvA"
+            )
+        )
+        cache.add_surface_transform(
+            _make_surface_transform(
+                f, "A", "B", "32k", "left", "sphere", provider="ProvB"
+            )
+        )
+        replacement = _make_surface_transform(
+            alt_f, "A", "B", "32k", "left", "sphere", provider="ProvA"
+        )
+        cache.add_surface_transform(replacement)
+        assert cache.get_surface_transform("A", "B", "32k", "left", "sphere") is (
+            replacement
+        )
+        cache.clear()
+        assert cache.get_surface_transform("A", "B", "32k", "left", "sphere") is None
+
     # ------------------------------------------------------------------ #
     # Branch 4: full miss                                                 #
     # ------------------------------------------------------------------ #
@@ -262,12 +362,154 @@ class TestGraphCacheSurface:
         )
         assert cache.get_surface_transform(*bad_key) is None
 
+    def test_bulk_add_indexes_first_provider(self, f: Path, alt_f: Path) -> None:
+        """Bulk insertion keeps provider-agnostic lookups on the first provider."""
+        cache = GraphCache()
+        t_first = _make_surface_transform(
+            f, "A", "B", "32k", "left", "sphere", provider="ProviderA"
+        )
+        t_second = _make_surface_transform(
+            alt_f, "A", "B", "32k", "left", "sphere", provider="ProviderB"
+        )
+        cache.add_surface_transforms([t_first, t_second])
+        assert len(cache.surface_transform) == 2
+        assert cache.get_surface_transform("A", "B", "32k", "left", "sphere") is (
+            t_first
+        )
+
+    def test_keys_interned_for_unchecked_resources(self, f: Path) -> None:
+        """Cache keys are interned even when resources skipped validation."""
+        cache = GraphCache()
+        density = "".join(["32", "k"])
+        transform = models.SurfaceTransform.unchecked(
+            name="t",
+            description=None,
+            file_path=f,
+            source_space="A",
+            target_space="B",
+            density=density,
+            hemisphere="left",
+            resource_type="sphere",
+            provider="ProviderA",
+        )
+        cache.add_surface_transform(transform)
+        (key,) = cache.surface_transform
+        assert key[2] is sys.intern("32k")
+        assert cache.get_surface_transforms("A", "B", density=density) == [transform]
+
+    def test_get_surface_transforms_by_pair(self, f: Path) -> None:
+        """Filtered searches only return transforms for the requested pair."""
+        cache = GraphCache()
+        t_left = _make_surface_transform(f, "A", "B", "32k", "left", "sphere")
+        t_right = _make_surface_transform(f, "A", "B", "32k", "right", "sphere")
+        t_other = _make_surface_transform(f, "B", "A", "32k", "left", "sphere")
+        cache.add_surface_transforms([t_left, t_other])
+        cache.add_surface_transform(t_right)
+        assert cache.get_surface_transforms("A", "B") == [t_left, t_right]
+        assert cache.get_surface_transforms("A", "B", hemisphere="right") == [t_right]
+        assert cache.get_surface_transforms("A", "C") == []
+
+    def test_constructor_tables_indexed(self, f: Path) -> None:
+        """Entries passed to the constructor are reachable through every lookup."""
+        transform = _make_surface_transform(f, "A", "B", "32k", "left", "sphere")
+        atlas = models.SurfaceAtlas(
+            name="A_left",
+            description="Sphere atlas",
+            file_path=f,
+            space="A",
+            density="32k",
+            hemisphere="left",
+            resource_type="sphere",
+        )
+        volume = _make_volume_transform(f, "A", "B", "1mm", "T1w")
+        volume_atlas = _make_volume_atlas(f, "A", "1mm", "T1w")
+        cache = GraphCache(
+            surface_atlas={("A", "32k", "left", "sphere"): atlas},
+            surface_transform={
+                ("A", "B", "32k", "left", "sphere", transform.provider): transform
+            },
+            volume_atlas={("A", "1mm", "T1w"): volume_atlas},
+            volume_transform={("A", "B", "1mm", "T1w", volume.provider): volume},
+        )
+        assert cache.get_surface_transform("A", "B", "32k", "left", "sphere") is (
+            transform
+        )
+        assert cache.get_surface_transforms("A", "B") == [transform]
+        assert cache.get_surface_atlases("A") == [atlas]
+        assert cache.get_volume_transform("A", "B", "1mm", "T1w") is volume
+        assert cache.get_volume_transforms("A", "B") == [volume]
+        assert cache.get_volume_atlases("A") == [volume_atlas]
+
+    def test_filtered_search_tolerates_concurrent_adds(self, f: Path) -> None:
+        """Filtered searches survive transforms being added from another thread."""
+        cache = GraphCache()
+        transforms = [
+            _make_surface_transform(f, "A", "B", f"{i}k", "left", "sphere")
+            for i in range(4000)
+        ]
+        errors: list[Exception] = []
+        done = threading.Event()
+
+        def search() -> None:
+            try:
+                while not done.is_set():
+                    cache.get_surface_transforms("A", "B", hemisphere="left")
+            except RuntimeError as exc:
+                errors.append(exc)
+
+        # Switch threads often so the scans interleave with the inserts
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            reader = threading.Thread(target=search)
+            reader.start()
+            for i in range(0, len(transforms), 2):
+                cache.add_surface_transforms(transforms[i : i + 2])
+            done.set()
+            reader.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert not errors
+        assert len(cache.get_surface_transforms("A", "B")) == len(transforms)
+
+    def test_density_key_memoised_on_add(self, f: Path) -> None:
+        """Densities of added transforms are parsed once and memoised."""
+        cache = GraphCache()
+        cache.add_surface_transform(
+            _make_surface_transform(f, "A", "B", "32k", "left", "sphere")
+        )
+        with patch(
+            "neuromaps_prime.graph.cache._get_density_key", side_effect=AssertionError
+        ):
+            assert cache.density_key("32k") == 32000
+        assert cache.density_key("164k") == 164000
+
     def test_hemisphere_case_insensitive(self, f: Path) -> None:
         """Hemisphere lookup is case-insensitive (stored as lowercase)."""
         cache = GraphCache()
         t = _make_surface_transform(f, "A", "B", "32k", "left", "sphere")
         cache.add_surface_transform(t)
         assert cache.get_surface_transform("A", "B", "32k", "left", "sphere") is t
+        for hemi in ("Left", "LEFT"):
+            lookup = ("A", "B", "32k", hemi, "sphere")
+            assert cache.get_surface_transform(*lookup) is t
+            assert cache.get_surface_transform(*lookup, provider=t.provider) is t
+
+    def test_get_surface_transforms_all_filters(self, f: Path) -> None:
+        """Fully-specified searches resolve with a direct, exact-provider lookup."""
+        cache = GraphCache()
+        t = _make_surface_transform(f, "A", "B", "32k", "left", "sphere")
+        cache.add_surface_transform(t)
+        kwargs = {"density": "32k", "resource_type": "sphere"}
+        assert cache.get_surface_transforms(
+            "A", "B", hemisphere="LEFT", provider="ProviderA", **kwargs
+        ) == [t]
+        assert (
+            cache.get_surface_transforms(
+                "A", "B", hemisphere="left", provider="ProviderB", **kwargs
+            )
+            == []
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -295,6 +537,7 @@ class TestGraphCacheAnnotations:
         a = _make_surface_annotation(f, "Yerkes19", "myelin", "32k", "left")
         cache.add_surface_annotation(a)
         assert cache.get_surface_annotation("Yerkes19", "myelin", "32k", "left") is a
+        assert cache.get_surface_annotation("Yerkes19", "myelin", "32k", "Left") is a
 
     def test_get_surface_annotation_miss(self) -> None:
         """Returns None when no matching surface annotation exists."""
@@ -496,6 +739,19 @@ class TestGraphCacheAnnotations:
         assert len(cache.surface_annotation) == 0
         assert len(cache.volume_annotation) == 0
 
+    def test_clear_covers_every_table(self) -> None:
+        """cache.clear() empties every table and index except the density memo."""
+        cache = GraphCache()
+        names = [
+            f.name
+            for f in fields(cache)
+            if f.name != "_density_keys" and isinstance(getattr(cache, f.name), dict)
+        ]
+        for name in names:
+            getattr(cache, name)["key"] = object()
+        cache.clear()
+        assert all(not getattr(cache, name) for name in names)
+
 
 # ---------------------------------------------------------------------------
 # Helpers shared by TestGraphCacheVolume
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import patch
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import networkx as nx
 import pytest
 
 from neuromaps_prime.graph import NeuromapsGraph, models
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from neuromaps_prime.graph import builder as builder_module
+from neuromaps_prime.graph.builder import GraphBuilder
+from neuromaps_prime.graph.cache import GraphCache
 
 
 class TestNeuromapsGraph:
@@ -62,6 +64,137 @@ class TestNeuromapsGraph:
         assert node.surface_annotations[0].label == "myelin"
         assert node.volume_annotations[0].label == "myelin"
 
+    def test_graph_build_yaml_snapshot(self, tmp_path: Path) -> None:
+        """Test a JSON snapshot is reused until the YAML contents change."""
+        yaml_file = tmp_path / "test_graph.yaml"
+        yaml_file.write_text("nodes:\n  - ALIEN:\n      species: extraterrestrial\n")
+        data_dir = tmp_path / "data"
+        NeuromapsGraph(yaml_file=yaml_file, data_dir=data_dir)
+        assert len(list((data_dir / ".graph_snapshots").iterdir())) == 1
+        assert not list(tmp_path.glob("*.snapshot.json"))
+
+        with patch("yaml.load") as mock_load:
+            graph = NeuromapsGraph(yaml_file=yaml_file, data_dir=data_dir)
+        mock_load.assert_not_called()
+        assert graph.get_node_data("ALIEN").species == "extraterrestrial"
+
+        # An edit that keeps the modification time is still picked up
+        mtime = yaml_file.stat().st_mtime_ns
+        yaml_file.write_text("nodes:\n  - ALIEN:\n      species: updated\n")
+        os.utime(yaml_file, ns=(mtime, mtime))
+        graph = NeuromapsGraph(yaml_file=yaml_file, data_dir=data_dir)
+        assert graph.get_node_data("ALIEN").species == "updated"
+        # ...and replaces the stale snapshot rather than adding to it
+        assert len(list((data_dir / ".graph_snapshots").iterdir())) == 1
+
+    def test_graph_build_lazy(self, tmp_path: Path) -> None:
+        """Test lazy graphs are populated on the first public lookup."""
+        yaml_file = tmp_path / "test_graph.yaml"
+        yaml_file.write_text("nodes:\n  - ALIEN:\n      species: extraterrestrial\n")
+        graph = NeuromapsGraph(yaml_file=yaml_file, data_dir=tmp_path, load="lazy")
+        assert graph.number_of_nodes() == 0
+
+        assert graph.get_node_data("ALIEN").species == "extraterrestrial"
+        assert graph.number_of_nodes() == 1
+
+    def test_graph_build_lazy_drops_early_lookups(self, tmp_path: Path) -> None:
+        """Test helper lookups made before a lazy build are not kept."""
+        graph = NeuromapsGraph(data_dir=tmp_path, load="lazy")
+        graph.utils._path_tables["surface_to_surface"] = {"Yerkes19": {}}
+
+        path = graph.find_path("Yerkes19", "fsLR", "surface_to_surface")
+        assert path[0] == "Yerkes19"
+        assert path[-1] == "fsLR"
+
+    def test_graph_build_background(self, tmp_path: Path) -> None:
+        """Test background builds are awaited by public lookups."""
+        yaml_file = tmp_path / "test_graph.yaml"
+        yaml_file.write_text("nodes:\n  - ALIEN:\n      species: extraterrestrial\n")
+        graph = NeuromapsGraph(
+            yaml_file=yaml_file, data_dir=tmp_path, load="background"
+        )
+        assert graph.get_node_data("ALIEN").species == "extraterrestrial"
+
+    def test_graph_build_background_error(self, tmp_path: Path) -> None:
+        """Test background build errors surface on the first public call."""
+        graph = NeuromapsGraph(
+            yaml_file=tmp_path / "missing.yaml", data_dir=tmp_path, load="background"
+        )
+        with pytest.raises(FileNotFoundError):
+            graph.find_path("A", "B")
+
+    def test_graph_invalid_load(self, tmp_path: Path) -> None:
+        """Test invalid load modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid load mode"):
+            NeuromapsGraph(data_dir=tmp_path, load="never")  # type: ignore[arg-type]
+
+    def test_load_snapshotted(self, tmp_path: Path) -> None:
+        """Test definitions are snapshotted under data_dir by content."""
+        source = tmp_path / "nodes" / "ALIEN.yaml"
+        source.parent.mkdir()
+        source.write_text("ALIEN:\n  species: extraterrestrial\n")
+        builder = GraphBuilder(cache=GraphCache(), data_dir=tmp_path / "data")
+
+        expected = {"ALIEN": {"species": "extraterrestrial"}}
+        assert builder._load_snapshotted(source) == expected
+        prefix = hashlib.sha256(os.fsencode(source)).hexdigest()[:16]
+        digest = hashlib.sha256(
+            builder_module._PACKAGE_VERSION.encode() + b"\0" + source.read_bytes()
+        ).hexdigest()
+        snapshots = tmp_path / "data" / ".graph_snapshots"
+        assert [p.name for p in snapshots.iterdir()] == [
+            f"{prefix}.{digest}.snapshot.json"
+        ]
+        with patch("yaml.load") as mock_load:
+            assert builder._load_snapshotted(source) == expected
+        mock_load.assert_not_called()
+
+        # Another package version never reads this snapshot, and replaces it
+        with (
+            patch.object(builder_module, "_PACKAGE_VERSION", "0.0.0-other"),
+            patch("yaml.load", return_value=expected) as mock_load,
+        ):
+            assert builder._load_snapshotted(source) == expected
+        mock_load.assert_called_once()
+        (snapshot,) = snapshots.iterdir()
+        assert snapshot.name.startswith(prefix)
+        assert digest not in snapshot.name
+
+    def test_load_snapshotted_skips_lossy_json(self, tmp_path: Path) -> None:
+        """Test definitions JSON would alter are reparsed instead of snapshotted."""
+        source = tmp_path / "graph.yaml"
+        source.write_text("1: one\n")
+        builder = GraphBuilder(cache=GraphCache(), data_dir=tmp_path / "data")
+        assert builder._load_snapshotted(source) == {1: "one"}
+        assert builder._load_snapshotted(source) == {1: "one"}
+        assert not (tmp_path / "data" / ".graph_snapshots").exists()
+
+    def test_write_snapshot_atomic(self, tmp_path: Path) -> None:
+        """Test failed snapshot writes leave neither a snapshot nor a partial file."""
+        snapshot = tmp_path / "graph.snapshot.json"
+        with patch.object(Path, "replace", side_effect=OSError):
+            assert not builder_module._write_snapshot(snapshot, {"a": 1})
+        assert not list(tmp_path.iterdir())
+        assert builder_module._write_snapshot(snapshot, {"a": 1})
+        assert [p.name for p in tmp_path.iterdir()] == [snapshot.name]
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_builder_normalises_hemisphere(
+        self, tmp_path: Path, *, trusted: bool
+    ) -> None:
+        """Test trusted and validated definitions share lowercase hemispheres."""
+        cache = GraphCache()
+        builder = GraphBuilder(cache=cache, data_dir=tmp_path)
+        builder._trusted = trusted
+        (atlas,), _ = builder._parse_surface_resources(
+            models.SurfaceAtlas,
+            {"space": "ALIEN", "description": ""},
+            {"32k": {"sphere": {"LEFT": "alien.surf.gii"}}},
+        )
+        assert atlas.hemisphere == "left"
+        cache.add_surface_atlas(atlas)
+        assert cache.get_surface_atlas("ALIEN", "32k", "left", "sphere") is atlas
+
     def test_graph_build(self, graph: NeuromapsGraph) -> None:
         """Test graph initialization."""
         info = graph.utils.get_graph_info()
@@ -72,6 +205,10 @@ class TestNeuromapsGraph:
         assert info["num_volumes"] >= 0
         assert info["num_surface_to_surface_transforms"] >= 0
         assert info["num_volume_to_volume_transforms"] >= 0
+        assert info["num_edges"] == (
+            info["num_surface_to_surface_transforms"]
+            + info["num_volume_to_volume_transforms"]
+        )
 
     def test_get_node_data(self, graph: NeuromapsGraph) -> None:
         """Test getting node data with proper error raised."""
@@ -111,10 +248,113 @@ class TestNeuromapsGraph:
 
     def test_no_valid_path(self, graph: NeuromapsGraph) -> None:
         """Testing no paths return empty."""
-        with patch("networkx.shortest_path", side_effect=nx.NetworkXNoPath):
-            path = graph.find_path("A", "B")
+        source, target = list(graph.nodes)[:2]
+        with patch("neuromaps_prime.graph.utils._dijkstra_paths", return_value={}):
+            path = graph.find_path(source, target)
         assert len(path) == 0
 
+    @pytest.mark.parametrize("missing", ["source", "target"])
+    def test_find_path_missing_node(self, graph: NeuromapsGraph, missing: str) -> None:
+        """Test spaces absent from the graph raise rather than return no path."""
+        space = next(iter(graph.nodes))
+        source, target = ("A", space) if missing == "source" else (space, "A")
+        with pytest.raises(nx.NodeNotFound):
+            graph.find_path(source, target)
+        assert not graph.utils._path_tables.get(None)
+
+    def test_find_path_table_cleared(self, graph: NeuromapsGraph) -> None:
+        """Test per-source path rows are reused until caches are cleared."""
+        source, target, other = list(graph.nodes)[:3]
+        with patch(
+            "neuromaps_prime.graph.utils._dijkstra_paths",
+            return_value={target: [source, target]},
+        ) as mock_paths:
+            assert graph.utils.find_path(source, target) == [source, target]
+            assert graph.utils.find_path(source, other) == []
+            mock_paths.assert_called_once()
+            graph.utils.clear_caches()
+            graph.utils.find_path(source, target)
+            assert mock_paths.call_count == 2
+
+    @pytest.mark.parametrize("edge_type", [None, "surface_to_surface"])
+    def test_find_path_matches_networkx(
+        self, graph: NeuromapsGraph, edge_type: str | None
+    ) -> None:
+        """Test the inline Dijkstra agrees with networkx on every source."""
+        g = graph.utils.get_subgraph(edge_type) if edge_type else graph
+        for source in graph.nodes:
+            expected = nx.single_source_dijkstra_path(g, source, weight="weight")
+            for target, path in expected.items():
+                assert graph.utils.find_path(source, target, edge_type) == path
+
+    def test_highest_density_memoised(
+        self, graph: NeuromapsGraph, tmp_path: Path
+    ) -> None:
+        """Test density queries are memoised until the cache changes."""
+        with patch.object(
+            GraphCache,
+            "get_surface_atlases",
+            autospec=True,
+            side_effect=GraphCache.get_surface_atlases,
+        ) as mock_atlases:
+            highest = graph.utils.find_highest_density("Yerkes19")
+            assert graph.utils.find_highest_density("Yerkes19") == highest
+            mock_atlases.assert_called_once()
+
+            sphere = tmp_path / "dense.surf.gii"
+            sphere.touch()
+            graph._cache.add_surface_atlas(
+                models.SurfaceAtlas(
+                    name="dense",
+                    description=None,
+                    file_path=sphere,
+                    space="Yerkes19",
+                    density="999k",
+                    hemisphere="left",
+                    resource_type="sphere",
+                )
+            )
+            assert graph.utils.find_highest_density("Yerkes19") == "999k"
+            assert mock_atlases.call_count == 2
+
+    def test_clear_caches(self, graph: NeuromapsGraph) -> None:
+        """Test clearing the graph drops every memoised query."""
+        source, target = next(iter(graph.edges()))
+        graph.find_path(source, target)
+        graph.find_highest_density("Yerkes19")
+        key = ("A", "B", "32k", "left", None, Path(), True)
+        graph.surface_ops._composed[key] = MagicMock()
+        graph.clear_caches()
+        assert not graph.utils._path_tables
+        assert not graph.utils._density_memo
+        assert not graph.surface_ops._composed
+
+    def test_find_path_memoised(self, graph: NeuromapsGraph, tmp_path: Path) -> None:
+        """Test repeated path queries are memoised until a transform is added."""
+        source, target = next(iter(graph.edges()))
+        first = graph.find_path(source, target)
+        first.append("mutated")
+        assert graph.find_path(source, target) == first[:-1]
+        assert graph.utils._path_tables
+
+        test_surf = tmp_path / "fake.surf.gii"
+        test_surf.touch()
+        graph.add_transform(
+            models.SurfaceTransform(
+                name="surface_xfm_test",
+                source_space=source,
+                target_space=target,
+                density="41k",
+                hemisphere="left",
+                resource_type="sphere",
+                file_path=test_surf,
+                provider="test",
+                description="Test surface transform",
+            ),
+            graph.surface_to_surface_key,
+        )
+        assert not graph.utils._path_tables
+
     def test_add_surface_transform_and_fetch(
         self, tmp_path: Path, graph: NeuromapsGraph
     ) -> None:
@@ -177,6 +417,34 @@ class TestNeuromapsGraph:
         fetched = graph.fetch_volume_to_volume_transform(source, target, "1mm", "T1w")
         assert fetched is vf
 
+    def test_add_transform_subclass(
+        self, tmp_path: Path, graph: NeuromapsGraph
+    ) -> None:
+        """Test subclasses of supported transforms are dispatched by their base."""
+
+        class CustomTransform(models.SurfaceTransform):
+            pass
+
+        test_surf = tmp_path / "fake.surf.gii"
+        test_surf.touch()
+        source, target = list(graph.nodes)[:2]
+        sf = CustomTransform(
+            name="custom_xfm_test",
+            source_space=source,
+            target_space=target,
+            density="41k",
+            hemisphere="left",
+            resource_type="midthickness",
+            file_path=test_surf,
+            provider="test",
+            description="Custom surface transform",
+        )
+        graph.add_transform(sf, graph.surface_to_surface_key)
+        fetched = graph.fetch_surface_to_surface_transform(
+            source, target, "41k", "left", "midthickness"
+        )
+        assert fetched is sf
+
     def test_add_invalid_transform(self, graph: NeuromapsGraph) -> None:
         """Test adding invalid transform type raises error."""
         with pytest.raises(TypeError, match="Unsupported transform type"):
@@ -225,7 +493,7 @@ class TestNeuromapsGraph:
         assert fetched is atlas
 
     def test_add_volume_atlas(self, tmp_path: Path, graph: NeuromapsGraph) -> None:
-        """Test adding a VolumeAtlas registers it to node and cache."""
+        """Test adding a VolumeAtlas registers it and drops memoised results."""
         test_vol = tmp_path / "fake_atlas.nii.gz"
         test_vol.touch()
         space = next(iter(graph.nodes))
@@ -239,11 +507,17 @@ class TestNeuromapsGraph:
             description="Test volume atlas",
         )
         initial_count = len(graph.nodes[space]["data"].volumes)
+        graph.volume_ops._projected[("stale",)] = test_vol
+        graph.surface_ops._composed[("A", "B", "32k", "left", None, Path(), True)] = (
+            MagicMock()
+        )
         graph.add_atlas(atlas)
 
         node_data = graph.nodes[space]["data"]
         assert len(node_data.volumes) == initial_count + 1
         assert atlas in node_data.volumes
+        assert not graph.volume_ops._projected
+        assert not graph.surface_ops._composed
 
         fetched = graph.fetch_volume_atlas(
             space=space, resolution="1mm", resource_type="T1w"
@@ -356,6 +630,21 @@ class TestNeuromapsGraph:
         subgraph = graph.utils.get_subgraph(edge_type=edges)
         assert isinstance(subgraph, nx.MultiDiGraph)
         assert set(subgraph.nodes) == set(graph.nodes)
+        assert all(key == edges for _, _, key in subgraph.edges(keys=True))
+        assert subgraph.number_of_edges() == sum(
+            key == edges for _, _, key in graph.edges(keys=True)
+        )
+        assert type(subgraph) is nx.MultiDiGraph
+        assert nx.is_frozen(subgraph)
+        with pytest.raises(nx.NetworkXError, match="Frozen"):
+            subgraph.add_node("ALIEN")
+
+        # The view is live: later graph edits show through it
+        source, target = list(graph.nodes)[:2]
+        graph.add_edge(source, target, key=edges, weight=1.0)
+        assert subgraph.has_edge(source, target, key=edges)
+        graph.add_edge(source, target, key="other", weight=1.0)
+        assert not subgraph.has_edge(source, target, key="other")
 
     def test_clear_evicts_all_cache_tables(self, graph: NeuromapsGraph) -> None:
         """Test all cache tables are cleared including annotation tables."""
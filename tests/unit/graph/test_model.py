@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 from unittest.mock import MagicMock, patch
@@ -162,6 +165,34 @@ class TestResources:
         with pytest.raises(FileNotFoundError, match="does not exist"):
             obj.fetch()
 
+    def test_concurrent_fetch_downloads_once(self, tmp_path: Path) -> None:
+        """Test threads fetching one resource share a single download."""
+        dest = tmp_path / "file.txt"
+        obj = models.SurfaceAnnotation(
+            name="test",
+            file_path=dest,
+            uri="https://files.osf.io/v1/resources/abcde",
+            space="Yerkes19",
+            density="32k",
+            hemisphere="left",
+            label="myelin",
+        )
+
+        def _download(uri: str, dest: Path) -> None:  # noqa: ARG001 # unused, necessary params
+            time.sleep(0.05)
+            dest.write_text("data")
+
+        with (
+            patch(
+                "neuromaps_prime.graph.models.download_and_validate",
+                side_effect=_download,
+            ) as mock_download,
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            results = list(pool.map(lambda _: obj.fetch(), range(4)))
+        mock_download.assert_called_once()
+        assert results == [dest] * 4
+
     def test_description_optional(self, tmp_file: Path) -> None:
         """Test that description defaults to None for annotation models."""
         surf_annot = models.SurfaceAnnotation(
@@ -182,6 +213,53 @@ class TestResources:
         assert surf_annot.description is None
         assert vol_annot.description is None
 
+    def test_hemisphere_normalised(self, tmp_file: Path) -> None:
+        """Test surface hemisphere is lower-cased on construction."""
+        atlas = models.SurfaceAtlas(
+            name="test",
+            description=None,
+            file_path=tmp_file,
+            space="Yerkes19",
+            density="32k",
+            hemisphere="Left",  # type: ignore[arg-type]
+            resource_type="sphere",
+        )
+        assert atlas.hemisphere == "left"
+
+    def test_key_fields_interned(self, tmp_file: Path) -> None:
+        """Test cache-key fields are interned on construction."""
+        transform = models.VolumeTransform(
+            name="test",
+            description=None,
+            file_path=tmp_file,
+            source_space="".join(["Yer", "kes19"]),
+            target_space="".join(["D", "99"]),
+            resolution="".join(["1", "mm"]),
+            resource_type="".join(["T1", "w"]),
+            provider="".join(["Rhe", "Map"]),
+        )
+        assert transform.source_space is sys.intern("Yerkes19")
+        assert transform.resolution is sys.intern("1mm")
+        assert transform.provider is sys.intern("RheMap")
+
+    def test_unchecked_skips_validation(self, tmp_path: Path) -> None:
+        """Test unchecked construction keeps values as given and fills defaults."""
+        missing = tmp_path / "not_written_yet.surf.gii"
+        transform = models.SurfaceTransform.unchecked(
+            name="test",
+            description=None,
+            file_path=missing,
+            source_space="A",
+            target_space="B",
+            density="32k",
+            hemisphere="left",
+            resource_type="sphere",
+            provider="test",
+        )
+        assert transform.file_path is missing
+        assert transform.uri is None
+        assert transform.weight == 1.0
+
 
 class TestNode:
     """Tests associated with Node model."""
@@ -277,7 +355,7 @@ class TestNode:
         surface_annotation: models.SurfaceAnnotation,
         volume_annotation: models.VolumeAnnotation,
     ) -> None:
-        """Test repr contains all resource names."""
+        """Test str lists all resource names while repr stays short."""
         node = models.Node(
             name="TestNode",
             species="Test",
@@ -287,7 +365,8 @@ class TestNode:
             surface_annotations=[surface_annotation],
             volume_annotations=[volume_annotation],
         )
-        r = repr(node)
+        assert repr(node) == "Node(name='TestNode', surfaces=1, volumes=1)"
+        r = str(node)
         assert "A test node" in r
         assert "TestSurface" in r
         assert "TestVolume" in r
@@ -314,7 +393,8 @@ class TestEdge:
         edge = models.Edge(surface_transforms=[surf_edge])
         assert len(edge.surface_transforms) == 1
         assert len(edge.volume_transforms) == 0
-        assert "SurfaceTransform" in repr(edge)
+        assert "SurfaceTransform" in str(edge)
+        assert repr(edge) == "Edge(surface_transforms=1, volume_transforms=0)"
 
     def test_init_defaults_to_empty(self) -> None:
         """Test that edge initializes with empty transform lists."""
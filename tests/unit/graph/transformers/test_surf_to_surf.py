@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, NamedTuple
@@ -168,6 +170,9 @@ class TestSurfaceToSurfaceTransformPrivate:
 
     def test_no_valid_path(self, mock_graph: NeuromapsGraph) -> None:
         """Test error raised if no valid path found."""
+        mock_graph.surface_ops.cache.get_surface_transform = MagicMock(
+            return_value=None
+        )
         mock_graph.surface_ops.utils.find_path = MagicMock(return_value=["only_source"])
         with pytest.raises(ValueError, match="No valid surface path from"):
             mock_graph.surface_ops._resolve_sphere_transform(
@@ -197,11 +202,53 @@ class TestSurfaceToSurfaceTransformPrivate:
             add_edge=False,
         )
         mock_graph.surface_ops.cache.get_surface_transform.assert_called_once()
+        mock_graph.surface_ops.utils.find_path.assert_not_called()
         assert out is mock_result
 
+    def test_cached_composition_not_reused_directly(
+        self, mock_graph: NeuromapsGraph
+    ) -> None:
+        """Test a cached sphere between non-neighbours is recomposed via a path."""
+        ops = mock_graph.surface_ops
+        ops.utils.graph.has_edge = MagicMock(return_value=False)
+        ops.cache.get_surface_transform = MagicMock()
+        ops.utils.find_path = MagicMock(return_value=["CIVETNMT", "Yerkes19", "fsLR"])
+        composed = MagicMock(spec=models.SurfaceTransform)
+        ops._compose_multihop = MagicMock(return_value=composed)
+        out = ops._resolve_sphere_transform(
+            source="CIVETNMT",
+            target="fsLR",
+            density="32k",
+            hemisphere="right",
+            output_file_path="multi_hop",
+        )
+        ops.cache.get_surface_transform.assert_not_called()
+        ops.utils.find_path.assert_called_once()
+        assert out is composed
+
+    def test_neighbours_without_density(self, mock_graph: NeuromapsGraph) -> None:
+        """Test None returned when neighbours lack a transform at the density."""
+        ops = mock_graph.surface_ops
+        ops.cache.get_surface_transform = MagicMock(return_value=None)
+        ops.utils.find_path = MagicMock(return_value=["Yerkes19", "fsLR"])
+        ops._compose_multihop = MagicMock()
+        out = ops._resolve_sphere_transform(
+            source="Yerkes19",
+            target="fsLR",
+            density="1k",
+            hemisphere="right",
+            output_file_path="single_hop",
+        )
+        assert out is None
+        ops.utils.find_path.assert_called_once()
+        ops._compose_multihop.assert_not_called()
+
     def test_multi_hop(self, mock_graph: NeuromapsGraph) -> None:
         """Test multi-hop path surface transformation."""
         mock_result = MagicMock(spec=models.SurfaceTransform)
+        mock_graph.surface_ops.cache.get_surface_transform = MagicMock(
+            return_value=None
+        )
         mock_graph.surface_ops.utils.find_path = MagicMock(
             return_value=["CIVETNMT", "Yerkes19", "fsLR"]
         )
@@ -217,6 +264,79 @@ class TestSurfaceToSurfaceTransformPrivate:
         mock_graph.surface_ops._compose_multihop.assert_called_once()
         assert out is mock_result
 
+    def test_multi_hop_memoised(
+        self, mock_graph: NeuromapsGraph, tmp_path: Path
+    ) -> None:
+        """Test multi-hop compositions are reused while their output exists."""
+        composed = tmp_path / "composed.surf.gii"
+        composed.touch()
+        mock_result = MagicMock(spec=models.SurfaceTransform, file_path=composed)
+        ops = mock_graph.surface_ops
+        ops.cache.get_surface_transform = MagicMock(return_value=None)
+        ops.utils.find_path = MagicMock(return_value=["CIVETNMT", "Yerkes19", "fsLR"])
+        ops._compose_multihop = MagicMock(return_value=mock_result)
+        kwargs = {
+            "source": "CIVETNMT",
+            "target": "fsLR",
+            "density": "32k",
+            "hemisphere": "right",
+            "output_file_path": "multi_hop",
+        }
+        assert ops._resolve_sphere_transform(**kwargs) is mock_result
+        assert ops._resolve_sphere_transform(**kwargs) is mock_result
+        ops._compose_multihop.assert_called_once()
+
+        # Another output directory or registration mode composes afresh
+        ops._resolve_sphere_transform(**kwargs, add_edge=False)
+        ops._resolve_sphere_transform(
+            **{**kwargs, "output_file_path": str(tmp_path / "other" / "multi_hop")}
+        )
+        assert ops._compose_multihop.call_count == 3
+        ops._compose_multihop.reset_mock()
+
+        composed.unlink()
+        ops._resolve_sphere_transform(**kwargs)
+        assert ops._compose_multihop.call_count == 1
+        ops.clear_caches()
+        composed.touch()
+        ops._resolve_sphere_transform(**kwargs)
+        assert ops._compose_multihop.call_count == 2
+
+    def test_multi_hop_compositions_overlap(
+        self, mock_graph: NeuromapsGraph, tmp_path: Path
+    ) -> None:
+        """Test compositions writing different hop files are not serialised."""
+        ops = mock_graph.surface_ops
+        ops.cache.get_surface_transform = MagicMock(return_value=None)
+        ops.utils.find_path = MagicMock(return_value=["CIVETNMT", "Yerkes19", "fsLR"])
+        # Both compositions must be inside _compose_multihop at once to pass
+        barrier = threading.Barrier(2, timeout=5)
+
+        def compose(**_: object) -> MagicMock:
+            barrier.wait()
+            return MagicMock(spec=models.SurfaceTransform)
+
+        ops._compose_multihop = MagicMock(side_effect=compose)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(
+                    ops._resolve_sphere_transform,
+                    source="CIVETNMT",
+                    target="fsLR",
+                    density="32k",
+                    hemisphere="right",
+                    output_file_path=str(tmp_path / name / "out.surf.gii"),
+                )
+                for name in ("a", "b")
+            ]
+            for future in futures:
+                future.result()
+        assert ops._compose_multihop.call_count == 2
+
+        same = ops._compose_lock(tmp_path, "CIVETNMT", "32k", "right")
+        assert ops._compose_lock(tmp_path, "CIVETNMT", "32k", "Right") is same
+        assert ops._compose_lock(tmp_path, "CIVETNMT", "32k", "left") is not same
+
     def test_compose_multihop_xfm(
         self, mock_graph: NeuromapsGraph, tmp_path: Path
     ) -> None:
@@ -239,13 +359,16 @@ class TestSurfaceToSurfaceTransformPrivate:
             add_edge=True,
         )
 
-        mock_graph.surface_ops.cache.get_surface_transform.assert_called_once()
+        # First hop, then the mid-to-target transform of each composed hop
+        assert mock_graph.surface_ops.cache.get_surface_transform.call_count == 3
         assert mock_graph.surface_ops._compose_next_hop.call_count == 2
 
         first_call = mock_graph.surface_ops._compose_next_hop.call_args_list[0][1]
         assert first_call["hop_idx"] == 2
         assert first_call["next_space"] == "C"
         assert first_call["current_transform"] == first_xfm
+        assert first_call["parent_dir"] == tmp_path
+        assert first_call["hemi_letter"] == "L"
 
         second_call = mock_graph.surface_ops._compose_next_hop.call_args_list[1][1]
         assert second_call["hop_idx"] == 3
@@ -253,6 +376,9 @@ class TestSurfaceToSurfaceTransformPrivate:
         assert second_call["current_transform"] == hop2_xfm
 
         assert result == hop3_xfm
+        mock_graph.surface_ops.cache.add_surface_transforms.assert_called_once_with(
+            [hop2_xfm, hop3_xfm]
+        )
 
     def test_compose_multihop_no_initial_xfm(self, mock_graph: NeuromapsGraph) -> None:
         """Test error raised when no initial transformation found."""
@@ -269,7 +395,58 @@ class TestSurfaceToSurfaceTransformPrivate:
             )
         mock_graph.surface_ops.cache.get_surface_transform.assert_called()
 
-    def test_compose_next_hop(self, mock_graph: NeuromapsGraph, tmp_path: Path) -> None:
+    def test_compose_multihop_resolves_all_hops_first(
+        self, mock_graph: NeuromapsGraph
+    ) -> None:
+        """Test a missing later hop fails before any hop is composed."""
+        first_xfm = MagicMock(spec=models.SurfaceTransform)
+        mock_graph.surface_ops.cache.get_surface_transform = MagicMock(
+            side_effect=[first_xfm, first_xfm, None]
+        )
+        mock_graph.surface_ops._compose_next_hop = MagicMock()
+        with pytest.raises(ValueError, match="No surface transform found from 'C'"):
+            mock_graph.surface_ops._compose_multihop(
+                path=["A", "B", "C", "D"],
+                density="32k",
+                hemisphere="left",
+                output_file_path="output.surf.gii",
+                add_edge=True,
+            )
+        mock_graph.surface_ops._compose_next_hop.assert_not_called()
+
+    def test_compose_multihop_prefetches_hops(
+        self, mock_graph: NeuromapsGraph, tmp_path: Path
+    ) -> None:
+        """Test every hop's resources are fetched before the first hop composes."""
+        first_xfm = MagicMock(spec=models.SurfaceTransform)
+        hop_xfm = MagicMock(spec=models.SurfaceTransform)
+        mid_atlas = MagicMock(spec=models.SurfaceAtlas)
+        mock_graph.surface_ops._resolve_hop = MagicMock(
+            return_value=(mid_atlas, hop_xfm)
+        )
+        mock_graph.surface_ops.cache.get_surface_transform = MagicMock(
+            return_value=first_xfm
+        )
+
+        def compose(**_: object) -> MagicMock:
+            for resource in (first_xfm, mid_atlas, hop_xfm):
+                resource.fetch.assert_called_once()
+            return MagicMock(spec=models.SurfaceTransform)
+
+        mock_graph.surface_ops._compose_next_hop = MagicMock(side_effect=compose)
+        mock_graph.surface_ops._compose_multihop(
+            path=["A", "B", "C", "D"],
+            density="32k",
+            hemisphere="left",
+            output_file_path=str(tmp_path / "output.surf.gii"),
+            add_edge=False,
+        )
+        assert mock_graph.surface_ops._compose_next_hop.call_count == 2
+
+    @pytest.mark.parametrize("hemisphere", ["right", "Right"])
+    def test_compose_next_hop(
+        self, mock_graph: NeuromapsGraph, tmp_path: Path, hemisphere: str
+    ) -> None:
         """Test basic composition of next hop."""
         current_transform = MagicMock(spec=models.SurfaceTransform)
         hop_output = str(tmp_path / "hop_output.surf.gii")
@@ -285,18 +462,24 @@ class TestSurfaceToSurfaceTransformPrivate:
             current_transform=current_transform,
             source="A",
             density="32k",
-            hemisphere="right",
-            output_file_path=str(tmp_path / "output.surf.gii"),
-            add_edge=True,
+            hemisphere=hemisphere,  # type: ignore[arg-type]
+            parent_dir=tmp_path,
+            hemi_letter="R",
         )
         mock_graph.surface_ops._hop_output_path.assert_called_once()
         mock_graph.surface_ops._two_hops.assert_called_once()
-        mock_graph.surface_ops.cache.add_surface_transform.assert_called_once()
+        mock_graph.surface_ops.cache.add_surface_transform.assert_not_called()
         assert isinstance(result, models.SurfaceTransform)
         assert result.source_space == "A"
         assert result.target_space == "C"
         assert result.file_path == composed_path
         assert result.weight == 2.0
+        assert result.hemisphere == "right"
+        cache = GraphCache()
+        cache.add_surface_transform(result)
+        assert cache.get_surface_transform("A", "C", "32k", "right", "sphere") is (
+            result
+        )
 
     def test_two_hops(self, mock_graph: NeuromapsGraph, tmp_path: Path) -> None:
         """Test two hop functionality."""
@@ -358,6 +541,26 @@ class TestSurfaceToSurfaceTransformPrivate:
                 first_transform=None,
             )
 
+    def test_two_hops_no_common_density_skips_fetch(
+        self, mock_graph: NeuromapsGraph
+    ) -> None:
+        """Test missing common density raises before any resource is fetched."""
+        first_transform = MagicMock(spec=models.SurfaceTransform)
+        mock_graph.surface_ops.utils.find_common_density = MagicMock(
+            side_effect=ValueError("No common density found")
+        )
+        with pytest.raises(ValueError, match="No common density found"):
+            mock_graph.surface_ops._two_hops(
+                source_space="A",
+                mid_space="B",
+                target_space="C",
+                density="32k",
+                hemisphere="left",
+                output_file_path="output.surf.gii",
+                first_transform=first_transform,
+            )
+        first_transform.fetch.assert_not_called()
+
     def test_two_hops_no_mid_atlas(
         self, mock_graph: NeuromapsGraph, tmp_path: Path
     ) -> None:
@@ -407,11 +610,11 @@ class TestSurfaceToSurfaceTransformPrivate:
     def test_hop_output_path(self, graph: NeuromapsGraph, tmp_path: Path) -> None:
         """Test generation of hop output file path."""
         output = graph.surface_ops._hop_output_path(
-            output_file_path=str(tmp_path / "output_file.surf.gii"),
+            parent_dir=tmp_path,
             source="A",
             next_target="B",
             density="32k",
-            hemisphere="left",
+            hemi_letter="L",
         )
         assert output == str(tmp_path / "src-A_to-B_den-32k_hemi-L_sphere.surf.gii")
 
@@ -519,3 +722,39 @@ class TestTransformSurface:
         )
         assert result is None
         mock_ops.surface_ops.cache.require_surface_atlas.assert_not_called()
+
+    def test_identity_copies_input(
+        self, mock_ops: NeuromapsGraph, basic_params: dict
+    ) -> None:
+        """Same space and density copies the input without resampling."""
+        basic_params["input_file"].write_text("data")
+        basic_params["target_space"] = basic_params["source_space"]
+        basic_params["target_density"] = basic_params["source_density"]
+        with patch(
+            "neuromaps_prime.graph.transforms.surface.metric_resample"
+        ) as mock_resample:
+            result = mock_ops.surface_ops.transform_surface(
+                transformer_type="metric", **basic_params
+            )
+        assert result == Path(basic_params["output_file_path"])
+        assert result.read_text() == "data"
+        mock_resample.assert_not_called()
+        mock_ops.surface_ops._resolve_sphere_transform.assert_not_called()
+
+    def test_batch_preserves_order(self, graph: NeuromapsGraph, tmp_path: Path) -> None:
+        """Test batched requests run concurrently and return in request order."""
+        outputs = [tmp_path / f"out{i}.func.gii" for i in range(3)]
+        # No call returns until every call has started; serial runs time out
+        barrier = threading.Barrier(len(outputs), timeout=5)
+
+        def transform(output_file_path: str, **_: object) -> Path:
+            barrier.wait()
+            return Path(output_file_path)
+
+        graph.surface_ops.transform_surface = MagicMock(side_effect=transform)
+        results = graph.surface_to_surface_transformer_batch(
+            [{"output_file_path": str(out)} for out in outputs],
+            max_workers=len(outputs),
+        )
+        assert results == outputs
+        assert graph.surface_ops.transform_surface_batch([]) == []
@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from typing import Literal
 
     from neuromaps_prime.graph import NeuromapsGraph
@@ -63,24 +63,32 @@ class TestVolumeToSurfaceTransformer:
         )
 
     def make_atlas_side_effect(
-        self,
-        tmp_path: Path,
-        **entities: dict[str, str],  # noqa: ARG002
-    ) -> Callable[[str, Literal["left", "right"], str, str], MagicMock]:
+        self, tmp_path: Path, missing: str | None = None
+    ) -> Callable[..., dict[str, MagicMock]]:
         """Create a side effect returning distinct atlases per resource type."""
 
-        def fetch_surface_atlas_side_effect(
+        def require_surface_atlases_side_effect(
+            space: str,
             density: str,
             hemisphere: Literal["left", "right"],
-            space: str,
-            resource_type: str,
-        ) -> MagicMock:
-            fname = f"hemi-{hemisphere}_den-{density}_space-{space}_{resource_type}"
-            surf_file = tmp_path / f"{fname}.surf.gii"
-            surf_file.touch()
-            return MagicMock(fetch=MagicMock(return_value=surf_file))
+            resource_types: Iterable[str],
+        ) -> dict[str, MagicMock]:
+            atlases = {}
+            for resource_type in resource_types:
+                if resource_type == missing:
+                    raise ValueError(
+                        f"No '{resource_type}' surface atlas found for space "
+                        f"'{space}' (density='{density}', hemisphere='{hemisphere}')"
+                    )
+                fname = f"hemi-{hemisphere}_den-{density}_space-{space}_{resource_type}"
+                surf_file = tmp_path / f"{fname}.surf.gii"
+                surf_file.touch()
+                atlases[resource_type] = MagicMock(
+                    fetch=MagicMock(return_value=surf_file)
+                )
+            return atlases
 
-        return fetch_surface_atlas_side_effect
+        return require_surface_atlases_side_effect
 
     @pytest.mark.parametrize("transformer_type", ["metric", "label"])
     def test_volume_to_surface_success(
@@ -96,7 +104,7 @@ class TestVolumeToSurfaceTransformer:
         projected_file = tmp_path / "projected.func.gii"
         projected_file.touch()
 
-        mock_transformer.volume_ops.cache.require_surface_atlas.side_effect = (
+        mock_transformer.volume_ops.cache.require_surface_atlases.side_effect = (
             self.make_atlas_side_effect(tmp_path)
         )
         with (
@@ -119,9 +127,15 @@ class TestVolumeToSurfaceTransformer:
         mock_transformer.volume_ops.utils.validate_spaces.assert_called_once_with(
             basic_params.source_space, basic_params.target_space
         )
-        assert mock_transformer.volume_ops.cache.require_surface_atlas.call_count == 3
+        mock_transformer.volume_ops.cache.require_surface_atlases.assert_called_once()
         mock_ribbon.assert_called_once()
+        ribbon_kwargs = mock_ribbon.call_args.kwargs
+        assert ribbon_kwargs["inner_surf"].name.endswith("_white.surf.gii")
+        assert ribbon_kwargs["outer_surf"].name.endswith("_pial.surf.gii")
         mock_surface_project.assert_called_once()
+        assert mock_surface_project.call_args.kwargs["surface"].name.endswith(
+            "_midthickness.surf.gii"
+        )
         mock_transformer.volume_ops.surface_ops.transform_surface.assert_called_once()
         assert result == expected_output
 
@@ -141,7 +155,7 @@ class TestVolumeToSurfaceTransformer:
         projected_file = tmp_path / f"projected.{expected_ext}.gii"
         projected_file.touch()
 
-        mock_transformer.volume_ops.cache.require_surface_atlas.side_effect = (
+        mock_transformer.volume_ops.cache.require_surface_atlases.side_effect = (
             self.make_atlas_side_effect(tmp_path)
         )
         mock_transformer.volume_ops.surface_ops.transform_surface.return_value = (
@@ -172,7 +186,7 @@ class TestVolumeToSurfaceTransformer:
         projected_file = tmp_path / "projected.func.gii"
         projected_file.touch()
 
-        mock_transformer.volume_ops.cache.require_surface_atlas.side_effect = (
+        mock_transformer.volume_ops.cache.require_surface_atlases.side_effect = (
             self.make_atlas_side_effect(tmp_path)
         )
         mock_transformer.volume_ops.surface_ops.transform_surface.return_value = Path(
@@ -196,7 +210,7 @@ class TestVolumeToSurfaceTransformer:
         self, mock_transformer: NeuromapsGraph, basic_params: BasicParams
     ) -> None:
         """Test ValueError raised when source midthickness surface atlas not found."""
-        mock_transformer.volume_ops.cache.require_surface_atlas.side_effect = (
+        mock_transformer.volume_ops.cache.require_surface_atlases.side_effect = (
             ValueError(
                 "No 'midthickness' surface atlas found for space "
                 f"'{basic_params.source_space}' "
@@ -207,48 +221,19 @@ class TestVolumeToSurfaceTransformer:
             ValueError, match="No 'midthickness' surface atlas found for space"
         ):
             mock_transformer.volume_to_surface_transformer(**basic_params._asdict())
-        mock_transformer.volume_ops.cache.require_surface_atlas.assert_called_once()
+        mock_transformer.volume_ops.cache.require_surface_atlases.assert_called_once()
 
-    @pytest.mark.parametrize(
-        ("failing_call", "missing_surface"),
-        [(2, "white"), (3, "pial")],
-    )
+    @pytest.mark.parametrize("missing_surface", ["white", "pial"])
     def test_no_ribbon_surface(
         self,
         mock_transformer: NeuromapsGraph,
         basic_params: BasicParams,
-        failing_call: int,
         missing_surface: str,
         tmp_path: Path,
     ) -> None:
         """Test ValueError raised when white or pial ribbon surface not found."""
-        base_side_effect = self.make_atlas_side_effect(tmp_path)
-        call_count = 0
-
-        def side_effect_with_failure(
-            density: str,
-            hemisphere: Literal["left", "right"],
-            space: str,
-            resource_type: str,
-        ) -> MagicMock:
-            nonlocal call_count
-            call_count += 1
-            if call_count == failing_call:
-                raise ValueError(
-                    f"No '{missing_surface}' surface atlas found for space "
-                    f"'{basic_params.source_space}' "
-                    f"(density='{basic_params.source_density}', "
-                    f"hemisphere='{basic_params.hemisphere}')"
-                )
-            return base_side_effect(
-                density=density,
-                hemisphere=hemisphere,
-                space=space,
-                resource_type=resource_type,
-            )
-
-        mock_transformer.volume_ops.cache.require_surface_atlas.side_effect = (
-            side_effect_with_failure
+        mock_transformer.volume_ops.cache.require_surface_atlases.side_effect = (
+            self.make_atlas_side_effect(tmp_path, missing=missing_surface)
         )
         with (
             patch(
@@ -270,3 +255,43 @@ class TestVolumeToSurfaceTransformer:
         )
         with pytest.raises(ValueError, match="Invalid transformer_type"):
             graph.volume_ops.transform_volume_to_surface(**basic_params._asdict())
+
+    def test_projection_memoised(
+        self,
+        mock_transformer: NeuromapsGraph,
+        basic_params: BasicParams,
+        tmp_path: Path,
+    ) -> None:
+        """Test projections are reused until the input or output changes."""
+        projected_file = tmp_path / "projected.func.gii"
+        projected_file.touch()
+        mock_transformer.volume_ops.cache.require_surface_atlases.side_effect = (
+            self.make_atlas_side_effect(tmp_path)
+        )
+        with (
+            patch(
+                "neuromaps_prime.graph.transforms.volume.workbench.volume_to_surface_mapping_ribbon_constrained"
+            ),
+            patch(
+                "neuromaps_prime.graph.transforms.volume.surface_project",
+                return_value=projected_file,
+            ) as mock_surface_project,
+        ):
+            for target_space in ("CIVETNMT", "fsLR"):
+                mock_transformer.volume_to_surface_transformer(
+                    **basic_params._replace(target_space=target_space)._asdict()
+                )
+            mock_surface_project.assert_called_once()
+
+            basic_params.input_file.write_bytes(b"changed")
+            mock_transformer.volume_to_surface_transformer(**basic_params._asdict())
+            assert mock_surface_project.call_count == 2
+
+            projected_file.unlink()
+            mock_transformer.volume_to_surface_transformer(**basic_params._asdict())
+            assert mock_surface_project.call_count == 3
+
+            mock_transformer.clear_caches()
+            projected_file.touch()
+            mock_transformer.volume_to_surface_transformer(**basic_params._asdict())
+            assert mock_surface_project.call_count == 4
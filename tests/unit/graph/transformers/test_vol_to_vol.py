@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import NamedTuple
 from unittest.mock import MagicMock, patch
@@ -127,3 +128,29 @@ class TestVolumeToVolumeTransformer:
         with pytest.raises(ValueError, match="No volume atlas found"):
             mock_transformer.volume_to_volume_transformer(**basic_params._asdict())
         mock_transformer.volume_ops.cache.get_volume_atlas.assert_called_once()
+
+    def test_batch_preserves_order(self, graph: NeuromapsGraph, tmp_path: Path) -> None:
+        """Test results keep request order when warps finish in reverse."""
+        outputs = [tmp_path / f"out{i}.nii.gz" for i in range(4)]
+        # Each warp finishes only after the next one has, so the first request
+        # completes last; run serially, the first warp would time out
+        finished = {out: threading.Event() for out in outputs}
+        completed: list[Path] = []
+
+        def warp(output_file_path: str, **_: object) -> Path:
+            out = Path(output_file_path)
+            idx = outputs.index(out)
+            if idx + 1 < len(outputs) and not finished[outputs[idx + 1]].wait(5):
+                raise TimeoutError(f"{outputs[idx + 1]} never finished")
+            completed.append(out)
+            finished[out].set()
+            return out
+
+        graph.volume_ops.transform_volume = MagicMock(side_effect=warp)
+        results = graph.volume_to_volume_transformer_batch(
+            [{"output_file_path": str(out)} for out in outputs],
+            max_workers=len(outputs),
+        )
+        assert completed == outputs[::-1]
+        assert results == outputs
+        assert graph.volume_ops.transform_volume_batch([]) == []
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from neuromaps_prime import remote
-from neuromaps_prime.fetcher import download_and_validate, id_storage
+from neuromaps_prime.fetcher import _prefetch, download_and_validate, id_storage
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -65,6 +66,52 @@ class TestDownloadAndValidate:
     ) -> None:
         """Test valid download."""
         dest = tmp_path / "out.surf.gii"
-        with patch.object(storage_cls, "download") as mock_download:
+        with patch.object(
+            storage_cls, "download", side_effect=lambda _, path: path.write_text("ok")
+        ) as mock_download:
             download_and_validate(mock_uri, dest)
-        mock_download.assert_called_once_with(mock_uri, dest)
+        mock_download.assert_called_once()
+        uri, partial = mock_download.call_args.args
+        assert uri == mock_uri
+        assert partial != dest
+        assert partial.parent == dest.parent
+        assert dest.read_text() == "ok"
+        assert not partial.exists()
+
+    def test_failed_download_leaves_no_file(self, tmp_path: Path) -> None:
+        """Test a download failing validation leaves neither file behind."""
+        dest = tmp_path / "out.surf.gii"
+
+        def _corrupt(_: str, path: Path) -> None:
+            path.write_text("partial")
+            raise ValueError("Checksum mismatch")
+
+        with (
+            patch.object(remote.OSFStorage, "download", side_effect=_corrupt),
+            pytest.raises(ValueError, match="Checksum mismatch"),
+        ):
+            download_and_validate("https://files.osf.io/v1/resources/abcde", dest)
+        assert not list(tmp_path.iterdir())
+
+
+class TestPrefetch:
+    """Test suite for concurrent resource fetching."""
+
+    def test_fetches_overlap_in_order(self, tmp_path: Path) -> None:
+        """Test every fetch runs at once and paths keep the resource order."""
+        paths = [tmp_path / f"{idx}.surf.gii" for idx in range(3)]
+        # Each fetch waits for all the others, so serial fetching times out
+        barrier = threading.Barrier(len(paths), timeout=5)
+
+        def fetcher(path: Path) -> MagicMock:
+            def fetch() -> Path:
+                barrier.wait()
+                return path
+
+            return MagicMock(fetch=MagicMock(side_effect=fetch))
+
+        assert _prefetch([fetcher(path) for path in paths]) == paths
+
+    def test_empty(self) -> None:
+        """Test nothing to fetch returns no paths."""
+        assert _prefetch([]) == []
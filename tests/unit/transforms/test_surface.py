@@ -8,15 +8,17 @@ from unittest.mock import MagicMock, _patch, patch
 
 import pytest
 from niwrap import workbench
+from styxdefs import LocalRunner
 
 from neuromaps_prime.transforms.surface import (
+    copy_unchanged,
     label_resample,
     metric_resample,
     surface_sphere_project_unproject,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from typing import Any
 
 
@@ -41,6 +43,38 @@ def _run_patched(
     return patch(func_path, side_effect=side_effect, return_value=return_value)
 
 
+@pytest.fixture
+def local_runner(tmp_path: Path) -> Iterator[LocalRunner]:
+    """Patch the global runner with a local runner writing under tmp_path."""
+    runner = LocalRunner(data_dir=tmp_path / "styx")
+    with patch("niwrap.get_global_runner", return_value=runner):
+        yield runner
+
+
+class TestCopyUnchanged:
+    """Tests for copying the input of a skipped identity transform."""
+
+    def test_relative_output_in_runner_dir(
+        self, tmp_path: Path, local_runner: LocalRunner
+    ) -> None:
+        """Test a relative output lands where the runner would write it."""
+        src = tmp_path / "in.shape.gii"
+        src.write_text("metric")
+        out = copy_unchanged(src, "out.shape.gii", workbench.METRIC_RESAMPLE_METADATA)
+        assert out.parent.parent == local_runner.data_dir
+        assert out.name == "out.shape.gii"
+        assert out.read_text() == "metric"
+
+    @pytest.mark.usefixtures("local_runner")
+    def test_output_is_input(self, tmp_path: Path) -> None:
+        """Test copying onto the input itself leaves it untouched."""
+        src = tmp_path / "in.shape.gii"
+        src.write_text("metric")
+        out = copy_unchanged(src, src, workbench.METRIC_RESAMPLE_METADATA)
+        assert out == src
+        assert src.read_text() == "metric"
+
+
 class TestSurfaceSphereProjectUnproject:
     """Test for project-unproject function."""
 
@@ -104,6 +138,28 @@ class TestSurfaceSphereProjectUnproject:
         ):
             surface_sphere_project_unproject(**mock_paths)
 
+    @pytest.mark.usefixtures("local_runner")
+    def test_identity_skips_workbench(self, tmp_path: Path) -> None:
+        """Test the input is copied when every input sphere is the same file."""
+        sphere = tmp_path / "sphere.surf.gii"
+        sphere.write_text("sphere")
+        out = tmp_path / "out.surf.gii"
+
+        func_path = (
+            "neuromaps_prime.transforms.surface."
+            "workbench.surface_sphere_project_unproject"
+        )
+        with _run_patched(func_path) as mock_wb:
+            result = surface_sphere_project_unproject(
+                sphere_in=sphere,
+                sphere_project_to=sphere,
+                sphere_unproject_from=str(sphere),
+                sphere_out=str(out),
+            )
+        mock_wb.assert_not_called()
+        assert result.sphere_out == out
+        assert out.read_text() == "sphere"
+
 
 class TestMetricResample:
     """Unit test of metric resample."""
@@ -138,6 +194,18 @@ class TestMetricResample:
         with pytest.raises(FileNotFoundError, match=msg):
             metric_resample(**mock_paths, method="ADAP_BARY_AREA")
 
+    def test_all_missing_inputs_reported(self, mock_paths: dict[str, Any]) -> None:
+        """Test every missing input is named in a single error."""
+        _touch_inputs(
+            mock_paths,
+            skip=("current_sphere", "new_sphere", "output_file_path", "area_surfs"),
+        )
+        with pytest.raises(FileNotFoundError) as exc_info:
+            metric_resample(**mock_paths, method="ADAP_BARY_AREA")
+        assert "Current sphere not found" in str(exc_info.value)
+        assert "New sphere not found" in str(exc_info.value)
+        assert "Input file" not in str(exc_info.value)
+
     def test_invalid_resample_method(self, mock_paths: dict[str, Any]) -> None:
         """Test NotImplementedError raised if invalid resample method passed."""
         _touch_inputs(mock_paths, skip=("output_file_path", "area_surfs"))
@@ -174,6 +242,32 @@ class TestMetricResample:
         ):
             metric_resample(**mock_paths, method="ADAP_BARY_AREA")
 
+    @pytest.mark.usefixtures("local_runner")
+    @pytest.mark.parametrize(
+        ("same_area", "calls"), [(True, 0), (False, 1)], ids=["identity", "area"]
+    )
+    def test_identity_skips_workbench(
+        self, mock_paths: dict[str, Any], *, same_area: bool, calls: int
+    ) -> None:
+        """Test workbench only runs unless spheres and area surfaces match."""
+        _touch_inputs(mock_paths, skip=("output_file_path",))
+        mock_paths["new_sphere"] = mock_paths["current_sphere"]
+        if same_area:
+            mock_paths["area_surfs"]["new-area"] = mock_paths["area_surfs"][
+                "current-area"
+            ]
+        mock_paths["input_file_path"].write_text("metric")
+
+        def _produce() -> MagicMock:
+            Path(mock_paths["output_file_path"]).touch()
+            return MagicMock(metric_out=Path(mock_paths["output_file_path"]))
+
+        func_path = "neuromaps_prime.transforms.surface.workbench.metric_resample"
+        with _run_patched(func_path, side_effect=lambda **_: _produce()) as mock_wb:
+            result = metric_resample(**mock_paths, method="ADAP_BARY_AREA")
+        assert mock_wb.call_count == calls
+        assert result.metric_out == Path(mock_paths["output_file_path"])
+
 
 class TestLabelResample:
     """Unit test of label resample."""
@@ -243,3 +337,17 @@ class TestLabelResample:
             pytest.raises(FileNotFoundError, match="Label out not found"),
         ):
             label_resample(**mock_paths, method="ADAP_BARY_AREA")
+
+    @pytest.mark.usefixtures("local_runner")
+    def test_identity_skips_workbench(self, mock_paths: dict[str, Any]) -> None:
+        """Test the label is copied when resampling onto the same sphere."""
+        _touch_inputs(mock_paths, skip=("output_file_path",))
+        mock_paths["new_sphere"] = mock_paths["current_sphere"]
+        mock_paths["area_surfs"]["new-area"] = mock_paths["area_surfs"]["current-area"]
+        mock_paths["input_file_path"].write_text("label")
+
+        func_path = "neuromaps_prime.transforms.surface.workbench.label_resample"
+        with _run_patched(func_path) as mock_wb:
+            result = label_resample(**mock_paths, method="ADAP_BARY_AREA")
+        mock_wb.assert_not_called()
+        assert result.label_out.read_text() == "label"
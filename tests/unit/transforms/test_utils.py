@@ -39,6 +39,23 @@ def test_get_vertex_count_invalid(mock_load: MagicMock) -> None:
         utils.get_vertex_count("test.nii.gz")
 
 
+@patch("neuromaps_prime.transforms.utils.nib.load")
+def test_get_vertex_count_cached(
+    mock_load: MagicMock, mock_gifti: MagicMock, tmp_path: Path
+) -> None:
+    """Test vertex counts are cached until the file changes."""
+    mock_load.return_value = mock_gifti
+    surface = tmp_path / "test.surf.gii"
+    surface.write_bytes(b"v1")
+    assert utils.get_vertex_count(surface) == VERTEX_CNT
+    assert utils.get_vertex_count(str(surface)) == VERTEX_CNT
+    mock_load.assert_called_once()
+
+    surface.write_bytes(b"version2")
+    utils.get_vertex_count(surface)
+    assert mock_load.call_count == 2
+
+
 @patch("neuromaps_prime.transforms.utils.get_vertex_count")
 def test_estimate_surface_density(mock_count: MagicMock) -> None:
     """Test surface density correctly estimated."""